@@ -5,7 +5,7 @@ import absl.logging
 import kinetic
 
 # Optional: Set your Keras backend
-os.environ["KERAS_BACKEND"] = "jax"
+os.environ.setdefault("KERAS_BACKEND", "jax")
 
 
 @kinetic.submit(accelerator="tpu-v5e-1")
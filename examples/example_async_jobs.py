@@ -23,7 +23,7 @@ Workflow overview:
 import os
 import time
 
-os.environ["KERAS_BACKEND"] = "jax"
+os.environ.setdefault("KERAS_BACKEND", "jax")
 
 import keras
 import numpy as np
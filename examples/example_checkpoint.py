@@ -1,7 +1,7 @@
 import os
 
 # Set backend to JAX before any keras imports
-os.environ["KERAS_BACKEND"] = "jax"
+os.environ.setdefault("KERAS_BACKEND", "jax")
 
 import kinetic
 
@@ -1,7 +1,7 @@
 import os
 
 # JAX must be set as the backend before importing Keras
-os.environ["KERAS_BACKEND"] = "jax"
+os.environ.setdefault("KERAS_BACKEND", "jax")
 
 import keras_hub
 
@@ -325,7 +325,7 @@ def run_inference(weights_path: str):
 
 
 if __name__ == "__main__":
-  os.environ["KERAS_BACKEND"] = "jax"
+  os.environ.setdefault("KERAS_BACKEND", "jax")
   os.environ["GOOGLE_CLOUD_PROJECT"] = "your-project-id"
   os.environ["KINETIC_ZONE"] = "us-central1-a"
   os.environ["GOOGLE_CLOUD_ZONE"] = "us-central1-a"
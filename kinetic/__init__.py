@@ -4,25 +4,61 @@ import os
 os.environ.setdefault("GRPC_VERBOSITY", "NONE")
 os.environ.setdefault("GRPC_ENABLE_FORK_SUPPORT", "0")
 
+import importlib
 import logging as python_logging
 import os
+from typing import TYPE_CHECKING
 
 from absl import logging
 from rich.console import Console
 from rich.logging import RichHandler
 
-from kinetic.collections import BatchError as BatchError
-from kinetic.collections import BatchHandle as BatchHandle
-from kinetic.collections import attach_batch as attach_batch
-from kinetic.collections import map as map
-from kinetic.core.core import run as run
-from kinetic.core.core import submit as submit
-from kinetic.data import Data as Data
-from kinetic.jobs import JobHandle as JobHandle
-from kinetic.jobs import attach as attach
-from kinetic.jobs import list_jobs as list_jobs
 from kinetic.version import __version__ as __version__
 
+if TYPE_CHECKING:
+  from kinetic.collections import BatchError as BatchError
+  from kinetic.collections import BatchHandle as BatchHandle
+  from kinetic.collections import attach_batch as attach_batch
+  from kinetic.collections import map as map
+  from kinetic.core.core import run as run
+  from kinetic.core.core import submit as submit
+  from kinetic.data import Data as Data
+  from kinetic.jobs import JobHandle as JobHandle
+  from kinetic.jobs import attach as attach
+  from kinetic.jobs import list_jobs as list_jobs
+
+# Public API, resolved on first attribute access (PEP 562). Importing
+# ``kinetic`` (e.g. for ``kinetic.core.accelerators`` in the CLI) no longer
+# pulls in the Kubernetes and Cloud client libraries behind ``run``/``submit``.
+_LAZY_ATTRS = {
+  "BatchError": "kinetic.collections",
+  "BatchHandle": "kinetic.collections",
+  "attach_batch": "kinetic.collections",
+  "map": "kinetic.collections",
+  "run": "kinetic.core.core",
+  "submit": "kinetic.core.core",
+  "Data": "kinetic.data",
+  "JobHandle": "kinetic.jobs",
+  "attach": "kinetic.jobs",
+  "list_jobs": "kinetic.jobs",
+}
+
+__all__ = ["__version__", *_LAZY_ATTRS]
+
+
+def __getattr__(name):
+  module_name = _LAZY_ATTRS.get(name)
+  if module_name is None:
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+  value = getattr(importlib.import_module(module_name), name)
+  globals()[name] = value
+  return value
+
+
+def __dir__():
+  return sorted(set(globals()) | set(_LAZY_ATTRS))
+
+
 logging.use_absl_handler()
 
 # Use rich to format the absl logs, making them slightly dimmed and links clickable
@@ -9,8 +9,10 @@ import concurrent.futures
 import hashlib
 import inspect
 import os
+import shutil
 import sys
 import tempfile
+import threading
 import uuid
 from dataclasses import dataclass, field
 from typing import Any, Callable, Optional
@@ -31,6 +33,12 @@ from kinetic.infra import container_builder
 from kinetic.jobs import JobHandle
 from kinetic.utils import packager, storage
 
+# Local cache of working-directory zips, reused across submissions while
+# the directory is unchanged.
+_CONTEXT_CACHE_DIR = os.path.expanduser("~/.kinetic/cache/context")
+
+_JOB_CONTEXT_DERIVED_FIELDS = ("bucket_name", "region", "display_name")
+
 
 @dataclass
 class JobContext:
@@ -79,9 +87,7 @@ class JobContext:
   context_sha256: Optional[str] = None
 
   def __post_init__(self):
-    self.bucket_name = build_bucket_name(self.project, self.cluster_name)
-    self.region = zone_to_region(self.zone)
-    self.display_name = f"kinetic-{self.func.__name__}-{self.job_id}"
+    self._set_derived_fields()
     if self.working_dir is None:
       self.working_dir = _resolve_working_dir(self.func)
 
@@ -89,6 +95,24 @@ class JobContext:
       self.output_dir = f"gs://{self.bucket_name}/outputs/{self.job_id}"
     self.env_vars["KINETIC_OUTPUT_DIR"] = self.output_dir
 
+  def _set_derived_fields(self):
+    self.bucket_name = build_bucket_name(self.project, self.cluster_name)
+    self.region = zone_to_region(self.zone)
+    self.display_name = f"kinetic-{self.func.__name__}-{self.job_id}"
+
+  def __getstate__(self):
+    # Derived fields are recomputed on load rather than pickled.
+    state = self.__dict__.copy()
+    for name in _JOB_CONTEXT_DERIVED_FIELDS:
+      state.pop(name, None)
+    return state
+
+  def __setstate__(self, state):
+    # Only the derived fields are recomputed; re-running __post_init__ would
+    # re-resolve working_dir and rewrite env_vars.
+    self.__dict__.update(state)
+    self._set_derived_fields()
+
   @classmethod
   def from_params(
     cls,
@@ -292,21 +316,25 @@ class PathwaysBackend(BaseK8sBackend):
     return pathways_client.job_exists(job_name, namespace=self.namespace)
 
 
+# Dependency files looked up by _find_requirements, in order of preference.
+_DEPENDENCY_FILE_NAMES = ("requirements.txt", "pyproject.toml")
+
+
 def _find_requirements(start_dir: str) -> Optional[str]:
   """Search up directory tree for requirements.txt or pyproject.toml.
 
   At each directory level, `requirements.txt` is preferred over
   `pyproject.toml`.  The first match found while walking towards the
-  filesystem root is returned.
+  filesystem root is returned.  The result is not cached: files may be
+  added between submissions from a long-lived session, and the walk is
+  only a couple of stat calls per level.
   """
   search_dir = start_dir
   while search_dir != "/":
-    req_path = os.path.join(search_dir, "requirements.txt")
-    if os.path.exists(req_path):
-      return req_path
-    pyproject_path = os.path.join(search_dir, "pyproject.toml")
-    if os.path.exists(pyproject_path):
-      return pyproject_path
+    for name in _DEPENDENCY_FILE_NAMES:
+      candidate = os.path.join(search_dir, name)
+      if os.path.isfile(candidate):
+        return candidate
     parent_dir = os.path.dirname(search_dir)
     if parent_dir == search_dir:
       break
@@ -488,7 +516,7 @@ def _prepare_artifacts(ctx: JobContext, tmpdir: str) -> None:
 
   # Serialize function + args (with volume refs)
   ctx.payload_path = os.path.join(tmpdir, "payload.pkl")
-  packager.save_payload(
+  ctx.payload_sha256 = packager.save_payload(
     ctx.func,
     ctx.args,
     ctx.kwargs,
@@ -497,13 +525,15 @@ def _prepare_artifacts(ctx: JobContext, tmpdir: str) -> None:
     volumes=volume_refs or None,
     working_dir=ctx.working_dir,
   )
-  ctx.payload_sha256 = _file_sha256(ctx.payload_path)
   logging.info("Payload serialized to %s", ctx.payload_path)
 
   # Zip working directory (excluding Data paths)
   ctx.context_path = os.path.join(tmpdir, "context.zip")
   packager.zip_working_dir(
-    caller_path, ctx.context_path, exclude_paths=exclude_paths
+    caller_path,
+    ctx.context_path,
+    exclude_paths=exclude_paths,
+    cache_dir=_CONTEXT_CACHE_DIR,
   )
   ctx.context_sha256 = _file_sha256(ctx.context_path)
   logging.info("Context packaged to %s", ctx.context_path)
@@ -594,16 +624,51 @@ def prepare_execution(ctx: JobContext, backend: BaseK8sBackend) -> None:
   )
   backend.validate_preflight(ctx)
 
-  with tempfile.TemporaryDirectory() as tmpdir:
+  tmpdir = tempfile.mkdtemp()
+  pool = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+  futures = []
+  try:
     _prepare_artifacts(ctx, tmpdir)
-    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as pool:
-      build_future = pool.submit(_build_container, ctx)
-      upload_future = pool.submit(_upload_artifacts, ctx)
-      # Collect results on the main thread — avoid mutating ctx in workers.
-      ctx.image_uri = build_future.result()
-      has_requirements = upload_future.result()
-      if not has_requirements:
-        ctx.requirements_path = None
+    build_future = pool.submit(_build_container, ctx)
+    futures.append(build_future)
+    upload_future = pool.submit(_upload_artifacts, ctx)
+    futures.append(upload_future)
+    # Surface the first failure immediately rather than after the
+    # (typically much slower) sibling phase has finished.
+    done, _ = concurrent.futures.wait(
+      futures, return_when=concurrent.futures.FIRST_EXCEPTION
+    )
+    for future in done:
+      future.result()
+    # Collect results on the main thread — avoid mutating ctx in workers.
+    ctx.image_uri = build_future.result()
+    has_requirements = upload_future.result()
+    if not has_requirements:
+      ctx.requirements_path = None
+  finally:
+    pool.shutdown(wait=False, cancel_futures=True)
+    # After an early failure the sibling phase may still be reading the
+    # artifacts, so the directory outlives this call until it settles.
+    _remove_when_settled(tmpdir, futures)
+
+
+def _remove_when_settled(path: str, futures: list) -> None:
+  """Delete *path* once every future in *futures* has finished."""
+  pending = set(futures)
+  lock = threading.Lock()
+
+  def _settled(future):
+    with lock:
+      pending.discard(future)
+      if pending:
+        return
+    shutil.rmtree(path, ignore_errors=True)
+
+  if not pending:
+    shutil.rmtree(path, ignore_errors=True)
+    return
+  for future in list(pending):
+    future.add_done_callback(_settled)
 
 
 def submit_remote(ctx: JobContext, backend: BaseK8sBackend) -> JobHandle:
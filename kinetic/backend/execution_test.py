@@ -1,8 +1,11 @@
 """Tests for kinetic.backend.execution — JobContext and submit_remote."""
 
+import hashlib
 import os
 import pathlib
 import tempfile
+import threading
+import time
 import zipfile
 from types import SimpleNamespace
 from unittest import mock
@@ -19,6 +22,7 @@ from kinetic.backend.execution import (
   _process_volumes,
   _requirements_uri,
   _upload_artifacts,
+  prepare_execution,
   submit_remote,
 )
 from kinetic.data import Data
@@ -55,6 +59,35 @@ class TestJobContext(absltest.TestCase):
     self.assertTrue(ctx.display_name.startswith("kinetic-my_train-"))
     self.assertRegex(ctx.job_id, r"^job-[0-9a-f]{8}$")
 
+  def test_pickle_omits_and_recomputes_derived_fields(self):
+    ctx = JobContext(
+      func=self._make_func(),
+      args=(1,),
+      kwargs={"a": 2},
+      env_vars={},
+      accelerator="cpu",
+      container_image=None,
+      zone="europe-west4-b",
+      project="my-proj",
+      cluster_name="my-cluster",
+      working_dir="/src",
+    )
+    ctx.payload_path = "/tmp/payload.pkl"
+
+    state = ctx.__getstate__()
+    for name in ("bucket_name", "region", "display_name"):
+      self.assertNotIn(name, state)
+
+    restored = cloudpickle.loads(cloudpickle.dumps(ctx))
+    self.assertEqual(restored.bucket_name, ctx.bucket_name)
+    self.assertEqual(restored.region, ctx.region)
+    self.assertEqual(restored.display_name, ctx.display_name)
+    self.assertEqual(restored.job_id, ctx.job_id)
+    self.assertEqual(restored.cluster_name, "my-cluster")
+    self.assertEqual(restored.working_dir, "/src")
+    self.assertEqual(restored.payload_path, "/tmp/payload.pkl")
+    self.assertEqual(restored.env_vars, ctx.env_vars)
+
   def test_from_params_resolves_zone_from_env(self):
     with mock.patch.dict(
       os.environ,
@@ -234,6 +267,18 @@ class TestFindRequirements(absltest.TestCase):
       str(child / "requirements.txt"),
     )
 
+  def test_skips_directory_named_like_dependency_file(self):
+    """A directory called requirements.txt is not mistaken for the file."""
+    tmp_path = _make_temp_path(self)
+    (tmp_path / "pyproject.toml").write_text(
+      '[project]\ndependencies = ["numpy"]\n'
+    )
+    (tmp_path / "requirements.txt").mkdir()
+    self.assertEqual(
+      _find_requirements(str(tmp_path)),
+      str(tmp_path / "pyproject.toml"),
+    )
+
 
 class TestPrepareArtifactsFuse(absltest.TestCase):
   """Tests for FUSE volume handling in _prepare_artifacts."""
@@ -280,7 +325,10 @@ class TestPrepareArtifactsFuse(absltest.TestCase):
     self.assertEqual(spec["mount_path"], "/data")
     self.assertTrue(spec["is_dir"])
     self.assertTrue(spec["read_only"])
-    self.assertEqual(ctx.payload_sha256, "dummy_hash")
+    self.assertEqual(
+      ctx.payload_sha256,
+      hashlib.sha256(pathlib.Path(ctx.payload_path).read_bytes()).hexdigest(),
+    )
     self.assertEqual(ctx.context_sha256, "dummy_hash")
 
   @mock.patch(
@@ -596,6 +644,105 @@ class TestUploadArtifactsRequirementsFlag(absltest.TestCase):
     self.assertTrue(has_requirements)
 
 
+class TestPrepareExecution(absltest.TestCase):
+  def setUp(self):
+    super().setUp()
+    self.enterContext(
+      mock.patch("kinetic.backend.execution.ensure_credentials")
+    )
+    self.mock_prepare = self.enterContext(
+      mock.patch("kinetic.backend.execution._prepare_artifacts")
+    )
+    self.ctx = SimpleNamespace(
+      project="proj",
+      zone="us-central1-a",
+      image_uri=None,
+      requirements_path="/tmp/requirements.txt",
+    )
+
+  def test_collects_build_and_upload_results(self):
+    with (
+      mock.patch(
+        "kinetic.backend.execution._build_container", return_value="img:tag"
+      ),
+      mock.patch(
+        "kinetic.backend.execution._upload_artifacts", return_value=False
+      ),
+    ):
+      prepare_execution(self.ctx, MagicMock())
+
+    self.assertEqual(self.ctx.image_uri, "img:tag")
+    self.assertIsNone(self.ctx.requirements_path)
+
+  def test_upload_failure_does_not_wait_for_build(self):
+    release_build = threading.Event()
+    self.addCleanup(release_build.set)
+
+    def slow_build(_ctx):
+      release_build.wait(timeout=30)
+      return "img:tag"
+
+    with (
+      mock.patch(
+        "kinetic.backend.execution._build_container", side_effect=slow_build
+      ),
+      mock.patch(
+        "kinetic.backend.execution._upload_artifacts",
+        side_effect=RuntimeError("upload failed"),
+      ),
+      self.assertRaisesRegex(RuntimeError, "upload failed"),
+    ):
+      prepare_execution(self.ctx, MagicMock())
+
+    self.assertFalse(release_build.is_set())
+    self.assertIsNone(self.ctx.image_uri)
+
+  def test_artifacts_outlive_early_failure_until_sibling_settles(self):
+    release_build = threading.Event()
+    self.addCleanup(release_build.set)
+    seen = []
+
+    def slow_build(_ctx):
+      release_build.wait(timeout=30)
+      seen.append(os.path.isdir(tmpdir))
+      return "img:tag"
+
+    with (
+      mock.patch(
+        "kinetic.backend.execution._build_container", side_effect=slow_build
+      ),
+      mock.patch(
+        "kinetic.backend.execution._upload_artifacts",
+        side_effect=RuntimeError("upload failed"),
+      ),
+      self.assertRaisesRegex(RuntimeError, "upload failed"),
+    ):
+      prepare_execution(self.ctx, MagicMock())
+
+    tmpdir = self.mock_prepare.call_args[0][1]
+    self.assertTrue(os.path.isdir(tmpdir))
+    release_build.set()
+    deadline = time.monotonic() + 10
+    while os.path.exists(tmpdir) and time.monotonic() < deadline:
+      time.sleep(0.01)
+
+    self.assertEqual(seen, [True])
+    self.assertFalse(os.path.exists(tmpdir))
+
+  def test_artifacts_removed_on_success(self):
+    with (
+      mock.patch(
+        "kinetic.backend.execution._build_container", return_value="img:tag"
+      ),
+      mock.patch(
+        "kinetic.backend.execution._upload_artifacts", return_value=True
+      ),
+    ):
+      prepare_execution(self.ctx, MagicMock())
+
+    self.assertFalse(os.path.exists(self.mock_prepare.call_args[0][1]))
+
+
 class TestSubmitRemote(absltest.TestCase):
   def _make_ctx(self):
     def train():
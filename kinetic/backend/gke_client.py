@@ -103,14 +103,24 @@ def submit_k8s_job(
       ) from e
 
 
-def wait_for_job(job, namespace="default", timeout=3600, poll_interval=10):
+def wait_for_job(
+  job,
+  namespace="default",
+  timeout=3600,
+  poll_interval=10,
+  max_poll_interval=k8s_utils.MAX_POLL_INTERVAL_SECONDS,
+):
   """Wait for Kubernetes Job to complete.
 
   Args:
       job: Kubernetes Job object
       namespace: Kubernetes namespace
       timeout: Maximum time to wait in seconds (default: 1 hour)
-      poll_interval: Time between status checks in seconds
+      poll_interval: Initial time between status checks in seconds.  The
+          job is watched in between, so status changes are picked up as
+          soon as the API server records them.
+      max_poll_interval: Upper bound the interval backs off to while the
+          job is unchanged.
 
   Returns:
       Job status: 'success'
@@ -122,22 +132,28 @@ def wait_for_job(job, namespace="default", timeout=3600, poll_interval=10):
   core_v1 = k8s_utils.core_v1()
 
   job_name = job.metadata.name
-  start_time = time.time()
+  deadline = time.monotonic() + timeout
   logged_running = False
   logged_pending = set()
+  pod_running = False
+  interval = poll_interval
+
+  # Job object delivered by the last watch event, if any; saves re-reading
+  # the status the watch has just sent.
+  job_status = None
 
   with LogStreamer(core_v1, namespace) as streamer:
     while True:
       # Check timeout
-      elapsed = time.time() - start_time
-      if elapsed > timeout:
+      if time.monotonic() >= deadline:
         raise RuntimeError(f"GKE job {job_name} timed out after {timeout}s")
 
       # Get job status
-      try:
-        job_status = batch_v1.read_namespaced_job_status(job_name, namespace)
-      except ApiException as e:
-        raise RuntimeError(f"Failed to read job status: {e.reason}") from e
+      if job_status is None:
+        try:
+          job_status = batch_v1.read_namespaced_job_status(job_name, namespace)
+        except ApiException as e:
+          raise RuntimeError(f"Failed to read job status: {e.reason}") from e
 
       # Check completion conditions
       if job_status.status.succeeded and job_status.status.succeeded >= 1:
@@ -153,19 +169,29 @@ def wait_for_job(job, namespace="default", timeout=3600, poll_interval=10):
           msg += f"\n{details}"
         raise RuntimeError(msg)
 
-      # Check for pod scheduling issues
-      k8s_utils.check_pod_scheduling(
-        core_v1, job_name, namespace, logged_pending
-      )
-
-      # Start log streaming when pod is running
-      with suppress(ApiException):
-        pods = core_v1.list_namespaced_pod(
-          namespace, label_selector=f"job-name={job_name}"
+      # List the job's pods once and use them both for the scheduling
+      # checks and to start log streaming when a pod is running.  Jobs
+      # run a single pod with no retries, so once it is running there is
+      # nothing left to schedule and the Job watch alone reports the
+      # outcome; stop listing pods from then on.  The list is served from
+      # the API server's watch cache (resource_version="0") rather than a
+      # quorum read; a slightly stale view is fine for a poll.
+      pods = None
+      if not pod_running:
+        with suppress(ApiException):
+          pods = core_v1.list_namespaced_pod(
+            namespace,
+            label_selector=f"job-name={job_name}",
+            resource_version="0",
+          ).items
+      if pods is not None:
+        k8s_utils.check_pod_scheduling(
+          core_v1, job_name, namespace, logged_pending, pods=pods
         )
-        for pod in pods.items:
+        for pod in pods:
           if pod.status.phase == "Running":
             streamer.start(pod.metadata.name)
+            pod_running = True
             break
 
       # Job still running
@@ -173,7 +199,21 @@ def wait_for_job(job, namespace="default", timeout=3600, poll_interval=10):
         logging.info("Job %s running...", job_name)
         logged_running = True
 
-      time.sleep(poll_interval)
+      # The reads above may have run past the deadline; report the
+      # timeout at the top of the loop rather than waiting again.
+      remaining = deadline - time.monotonic()
+      if remaining <= 0:
+        continue
+      changed = k8s_utils.wait_for_change(
+        batch_v1.list_namespaced_job,
+        job_status,
+        namespace,
+        min(interval, remaining),
+      )
+      interval = k8s_utils.next_poll_interval(
+        interval, changed is not job_status, poll_interval, max_poll_interval
+      )
+      job_status = changed
 
 
 def cleanup_job(
@@ -305,9 +345,8 @@ def list_jobs(namespace="default") -> list[dict[str, str]]:
 
 @functools.lru_cache(maxsize=1)
 def _batch_v1():
-  """Return a cached BatchV1Api client, loading kubeconfig on first call."""
-  k8s_utils.load_kube_config()
-  return client.BatchV1Api()
+  """Return a cached BatchV1Api client on the shared ApiClient."""
+  return client.BatchV1Api(k8s_utils.api_client())
 
 
 def _create_job_spec(
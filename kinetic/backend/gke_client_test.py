@@ -1,5 +1,6 @@
 """Tests for kinetic.backend.gke_client — K8s job submission and monitoring."""
 
+from types import SimpleNamespace
 from unittest import mock
 from unittest.mock import MagicMock
 
@@ -261,16 +262,30 @@ class TestWaitForJob(absltest.TestCase):
     self.mock_streamer.__exit__ = MagicMock(return_value=False)
 
   def _make_mock_job(self):
-    job = MagicMock()
-    job.metadata.name = "kinetic-job-abc"
-    return job
+    return SimpleNamespace(metadata=SimpleNamespace(name="kinetic-job-abc"))
+
+  def _make_job_status(self, succeeded=None, failed=None):
+    return SimpleNamespace(
+      metadata=SimpleNamespace(name="kinetic-job-abc", resource_version="1"),
+      status=SimpleNamespace(succeeded=succeeded, failed=failed),
+    )
+
+  def _make_pod(self, phase, name="kinetic-job-abc-pod"):
+    return SimpleNamespace(
+      metadata=SimpleNamespace(name=name),
+      spec=SimpleNamespace(node_selector=None),
+      status=SimpleNamespace(
+        phase=phase,
+        conditions=None,
+        container_statuses=None,
+        init_container_statuses=None,
+      ),
+    )
 
   def test_first_poll_success(self):
     mock_batch = MagicMock()
-    mock_status = MagicMock()
-    mock_status.status.succeeded = 1
-    mock_status.status.failed = None
-    mock_batch.read_namespaced_job_status.return_value = mock_status
+    job_status = self._make_job_status(succeeded=1)
+    mock_batch.read_namespaced_job_status.return_value = job_status
 
     mock_core = MagicMock()
     mock_core.list_namespaced_pod.return_value.items = []
@@ -291,10 +306,8 @@ class TestWaitForJob(absltest.TestCase):
 
   def test_first_poll_failure(self):
     mock_batch = MagicMock()
-    mock_status = MagicMock()
-    mock_status.status.succeeded = None
-    mock_status.status.failed = 1
-    mock_batch.read_namespaced_job_status.return_value = mock_status
+    job_status = self._make_job_status(failed=1)
+    mock_batch.read_namespaced_job_status.return_value = job_status
 
     mock_core = MagicMock()
     mock_core.list_namespaced_pod.return_value.items = []
@@ -314,21 +327,18 @@ class TestWaitForJob(absltest.TestCase):
 
   def test_failure_includes_pod_details(self):
     mock_batch = MagicMock()
-    mock_status = MagicMock()
-    mock_status.status.succeeded = None
-    mock_status.status.failed = 1
-    mock_batch.read_namespaced_job_status.return_value = mock_status
-
-    pod = MagicMock()
-    pod.metadata.name = "kinetic-job-abc-xyz"
-    terminated = MagicMock()
-    terminated.exit_code = 1
-    terminated.reason = "Error"
-    terminated.message = None
-    cs = MagicMock()
-    cs.state.terminated = terminated
-    cs.last_state.terminated = None
-    pod.status.container_statuses = [cs]
+    job_status = self._make_job_status(failed=1)
+    mock_batch.read_namespaced_job_status.return_value = job_status
+
+    pod = self._make_pod("Failed", name="kinetic-job-abc-xyz")
+    terminated = SimpleNamespace(exit_code=1, reason="Error", message=None)
+    pod.status.container_statuses = [
+      SimpleNamespace(
+        name="kinetic-worker",
+        state=SimpleNamespace(terminated=terminated),
+        last_state=SimpleNamespace(terminated=None),
+      )
+    ]
 
     mock_core = MagicMock()
     mock_core.list_namespaced_pod.return_value.items = [pod]
@@ -357,10 +367,8 @@ class TestWaitForJob(absltest.TestCase):
 
   def test_timeout_raises(self):
     mock_batch = MagicMock()
-    mock_status = MagicMock()
-    mock_status.status.succeeded = None
-    mock_status.status.failed = None
-    mock_batch.read_namespaced_job_status.return_value = mock_status
+    job_status = self._make_job_status()
+    mock_batch.read_namespaced_job_status.return_value = job_status
 
     with (
       mock.patch(
@@ -375,12 +383,8 @@ class TestWaitForJob(absltest.TestCase):
 
   def test_polls_until_success(self):
     mock_batch = MagicMock()
-    running = MagicMock()
-    running.status.succeeded = None
-    running.status.failed = None
-    succeeded = MagicMock()
-    succeeded.status.succeeded = 1
-    succeeded.status.failed = None
+    running = self._make_job_status()
+    succeeded = self._make_job_status(succeeded=1)
     mock_batch.read_namespaced_job_status.side_effect = [running, succeeded]
 
     mock_core = MagicMock()
@@ -395,25 +399,23 @@ class TestWaitForJob(absltest.TestCase):
         "kinetic.backend.k8s_utils.core_v1",
         return_value=mock_core,
       ),
-      mock.patch("kinetic.backend.gke_client.time.sleep") as mock_sleep,
+      mock.patch(
+        "kinetic.backend.k8s_utils.wait_for_change", return_value=None
+      ) as mock_wait,
     ):
       result = wait_for_job(self._make_mock_job(), poll_interval=5)
     self.assertEqual(result, "success")
-    mock_sleep.assert_called_with(5)
+    mock_wait.assert_called_once_with(
+      mock_batch.list_namespaced_job, running, "default", 5
+    )
 
   def test_starts_streaming_when_pod_running(self):
     mock_batch = MagicMock()
-    running = MagicMock()
-    running.status.succeeded = None
-    running.status.failed = None
-    succeeded = MagicMock()
-    succeeded.status.succeeded = 1
-    succeeded.status.failed = None
+    running = self._make_job_status()
+    succeeded = self._make_job_status(succeeded=1)
     mock_batch.read_namespaced_job_status.side_effect = [running, succeeded]
 
-    running_pod = MagicMock()
-    running_pod.status.phase = "Running"
-    running_pod.metadata.name = "kinetic-job-abc-pod"
+    running_pod = self._make_pod("Running")
 
     mock_core = MagicMock()
     mock_core.list_namespaced_pod.return_value.items = [running_pod]
@@ -427,26 +429,61 @@ class TestWaitForJob(absltest.TestCase):
         "kinetic.backend.k8s_utils.core_v1",
         return_value=mock_core,
       ),
-      mock.patch("kinetic.backend.gke_client.time.sleep"),
+      mock.patch(
+        "kinetic.backend.k8s_utils.wait_for_change", return_value=None
+      ),
     ):
       result = wait_for_job(self._make_mock_job())
 
     self.assertEqual(result, "success")
     self.mock_streamer.start.assert_called_once_with("kinetic-job-abc-pod")
+    # One pod list per poll serves both scheduling checks and streaming.
+    mock_core.list_namespaced_pod.assert_called_once_with(
+      "default", label_selector="job-name=kinetic-job-abc", resource_version="0"
+    )
+
+  def test_stops_listing_pods_once_running(self):
+    mock_batch = MagicMock()
+    running = self._make_job_status()
+    succeeded = self._make_job_status(succeeded=1)
+    mock_batch.read_namespaced_job_status.side_effect = [
+      running,
+      running,
+      running,
+      succeeded,
+    ]
+
+    running_pod = self._make_pod("Running")
+
+    mock_core = MagicMock()
+    mock_core.list_namespaced_pod.return_value.items = [running_pod]
+
+    with (
+      mock.patch(
+        "kinetic.backend.gke_client._batch_v1",
+        return_value=mock_batch,
+      ),
+      mock.patch(
+        "kinetic.backend.k8s_utils.core_v1",
+        return_value=mock_core,
+      ),
+      mock.patch(
+        "kinetic.backend.k8s_utils.wait_for_change", return_value=None
+      ),
+    ):
+      result = wait_for_job(self._make_mock_job())
+
+    self.assertEqual(result, "success")
+    self.assertEqual(mock_batch.read_namespaced_job_status.call_count, 4)
+    mock_core.list_namespaced_pod.assert_called_once()
 
   def test_no_streaming_when_pod_pending(self):
     mock_batch = MagicMock()
-    running = MagicMock()
-    running.status.succeeded = None
-    running.status.failed = None
-    succeeded = MagicMock()
-    succeeded.status.succeeded = 1
-    succeeded.status.failed = None
+    running = self._make_job_status()
+    succeeded = self._make_job_status(succeeded=1)
     mock_batch.read_namespaced_job_status.side_effect = [running, succeeded]
 
-    pending_pod = MagicMock()
-    pending_pod.status.phase = "Pending"
-    pending_pod.status.conditions = None
+    pending_pod = self._make_pod("Pending")
 
     mock_core = MagicMock()
     mock_core.list_namespaced_pod.return_value.items = [pending_pod]
@@ -460,13 +497,160 @@ class TestWaitForJob(absltest.TestCase):
         "kinetic.backend.k8s_utils.core_v1",
         return_value=mock_core,
       ),
-      mock.patch("kinetic.backend.gke_client.time.sleep"),
+      mock.patch(
+        "kinetic.backend.k8s_utils.wait_for_change", return_value=None
+      ),
     ):
       result = wait_for_job(self._make_mock_job())
 
     self.assertEqual(result, "success")
     self.mock_streamer.start.assert_not_called()
 
+  def test_unchanged_job_is_not_reread(self):
+    mock_batch = MagicMock()
+    running = self._make_job_status()
+    succeeded = self._make_job_status(succeeded=1)
+    mock_batch.read_namespaced_job_status.return_value = running
+
+    mock_core = MagicMock()
+    mock_core.list_namespaced_pod.return_value.items = []
+
+    with (
+      mock.patch(
+        "kinetic.backend.gke_client._batch_v1",
+        return_value=mock_batch,
+      ),
+      mock.patch(
+        "kinetic.backend.k8s_utils.core_v1",
+        return_value=mock_core,
+      ),
+      mock.patch(
+        "kinetic.backend.k8s_utils.wait_for_change",
+        side_effect=[running, running, succeeded],
+      ),
+    ):
+      result = wait_for_job(self._make_mock_job())
+
+    self.assertEqual(result, "success")
+    mock_batch.read_namespaced_job_status.assert_called_once()
+
+  def test_watch_window_widens_while_job_unchanged(self):
+    mock_batch = MagicMock()
+    running = self._make_job_status()
+    ready = self._make_job_status()
+    succeeded = self._make_job_status(succeeded=1)
+    mock_batch.read_namespaced_job_status.return_value = running
+
+    mock_core = MagicMock()
+    mock_core.list_namespaced_pod.return_value.items = []
+
+    with (
+      mock.patch(
+        "kinetic.backend.gke_client._batch_v1",
+        return_value=mock_batch,
+      ),
+      mock.patch(
+        "kinetic.backend.k8s_utils.core_v1",
+        return_value=mock_core,
+      ),
+      mock.patch(
+        "kinetic.backend.k8s_utils.wait_for_change",
+        side_effect=[running, running, running, ready, succeeded],
+      ) as mock_wait,
+    ):
+      wait_for_job(self._make_mock_job(), poll_interval=5, max_poll_interval=12)
+
+    intervals = [c[0][3] for c in mock_wait.call_args_list]
+    self.assertEqual(intervals, [5, 10, 12, 12, 5])
+
+  def test_watch_window_capped_at_time_remaining(self):
+    mock_batch = MagicMock()
+    running = self._make_job_status()
+    mock_batch.read_namespaced_job_status.return_value = running
+
+    mock_core = MagicMock()
+    mock_core.list_namespaced_pod.return_value.items = []
+
+    with (
+      mock.patch(
+        "kinetic.backend.gke_client._batch_v1",
+        return_value=mock_batch,
+      ),
+      mock.patch(
+        "kinetic.backend.k8s_utils.core_v1",
+        return_value=mock_core,
+      ),
+      mock.patch(
+        "kinetic.backend.gke_client.time.monotonic",
+        side_effect=[0, 0, 25, 30],
+      ),
+      mock.patch(
+        "kinetic.backend.k8s_utils.wait_for_change",
+        return_value=running,
+      ) as mock_wait,
+      self.assertRaisesRegex(RuntimeError, "timed out"),
+    ):
+      wait_for_job(self._make_mock_job(), timeout=30, poll_interval=10)
+
+    mock_wait.assert_called_once_with(
+      mock_batch.list_namespaced_job, running, "default", 5
+    )
+
+  def test_deadline_passing_mid_iteration_raises_timeout(self):
+    mock_batch = MagicMock()
+    mock_batch.read_namespaced_job_status.return_value = self._make_job_status()
+
+    mock_core = MagicMock()
+    mock_core.list_namespaced_pod.return_value.items = []
+
+    with (
+      mock.patch(
+        "kinetic.backend.gke_client._batch_v1",
+        return_value=mock_batch,
+      ),
+      mock.patch(
+        "kinetic.backend.k8s_utils.core_v1",
+        return_value=mock_core,
+      ),
+      mock.patch(
+        "kinetic.backend.gke_client.time.monotonic",
+        side_effect=[0, 0, 5, 5],
+      ),
+      mock.patch("kinetic.backend.k8s_utils.wait_for_change") as mock_wait,
+      self.assertRaisesRegex(RuntimeError, "timed out"),
+    ):
+      wait_for_job(self._make_mock_job(), timeout=3)
+
+    mock_wait.assert_not_called()
+
+  def test_uses_job_from_watch_event_without_rereading(self):
+    mock_batch = MagicMock()
+    running = self._make_job_status()
+    succeeded = self._make_job_status(succeeded=1)
+    mock_batch.read_namespaced_job_status.return_value = running
+
+    mock_core = MagicMock()
+    mock_core.list_namespaced_pod.return_value.items = []
+
+    with (
+      mock.patch(
+        "kinetic.backend.gke_client._batch_v1",
+        return_value=mock_batch,
+      ),
+      mock.patch(
+        "kinetic.backend.k8s_utils.core_v1",
+        return_value=mock_core,
+      ),
+      mock.patch(
+        "kinetic.backend.k8s_utils.wait_for_change",
+        return_value=succeeded,
+      ),
+    ):
+      result = wait_for_job(self._make_mock_job())
+
+    self.assertEqual(result, "success")
+    mock_batch.read_namespaced_job_status.assert_called_once()
+
 
 class TestAsyncObservationHelpers(absltest.TestCase):
   def setUp(self):
@@ -2,12 +2,15 @@
 
 import functools
 import posixpath
+import time
 from contextlib import suppress
 
+import urllib3
 from absl import logging
 from google.cloud import container_v1
-from kubernetes import client, config
+from kubernetes import client, config, watch
 from kubernetes.client.rest import ApiException
+from urllib3.util.retry import Retry
 
 from kinetic.core import accelerators
 from kinetic.core.accelerators import TpuConfig
@@ -28,6 +31,28 @@ GCSFUSE_CSI_DRIVER = "gcsfuse.csi.storage.gke.io"
 GCSFUSE_VOLUMES_ANNOTATION = "gke-gcsfuse/volumes"
 GCSFUSE_DEFAULT_MOUNT_OPTIONS = "implicit-dirs"
 
+# Size of the urllib3 pool shared by all Kubernetes API clients. Log
+# streaming threads and status polls run concurrently against one host.
+_API_CONNECTION_POOL_MAXSIZE = 16
+
+# Retry policy for Kubernetes API requests.  Throttling (429) and transient
+# server errors are retried with exponential backoff, honouring Retry-After.
+# urllib3 only retries idempotent methods, so a job create is never
+# replayed, and raise_on_status=False hands the final response back to the
+# client so callers still see an ApiException once retries run out.
+_API_RETRY = Retry(
+  total=5,
+  backoff_factor=0.5,
+  status_forcelist=(429, 500, 502, 503, 504),
+  raise_on_status=False,
+)
+
+# While a watched object stays unchanged, wait_for_job in both backends
+# widens the watch window by POLL_BACKOFF_FACTOR per quiet round, up to
+# max_poll_interval, and drops back to poll_interval once it changes.
+POLL_BACKOFF_FACTOR = 2
+MAX_POLL_INTERVAL_SECONDS = 30
+
 
 def build_gcs_fuse_volumes(
   fuse_volume_specs: list[dict] | None,
@@ -130,8 +155,18 @@ def build_gcs_fuse_v1_volumes(
 
 def parse_accelerator(accelerator, spot=False):
   """Convert accelerator string to GKE pod spec fields."""
-  parsed = accelerators.parse_accelerator(accelerator, spot=spot)
+  return accelerator_pod_fields(
+    accelerators.parse_accelerator(accelerator, spot=spot)
+  )
+
 
+def accelerator_pod_fields(parsed):
+  """Convert an already-parsed accelerator config to GKE pod spec fields.
+
+  Callers that also need the `GpuConfig`/`TpuConfig` itself should parse
+  once and pass it here rather than calling `parse_accelerator` as well.
+  A fresh dict is returned on every call, so callers may mutate it.
+  """
   if parsed is None:
     return {
       "node_selector": {},
@@ -213,10 +248,83 @@ def load_kube_config():
 
 
 @functools.lru_cache(maxsize=1)
-def core_v1():
-  """Return a cached CoreV1Api client, loading kubeconfig on first call."""
+def api_client():
+  """Return the process-wide ApiClient, loading kubeconfig on first call.
+
+  All typed API wrappers share this client so that they also share one
+  urllib3 connection pool and keep-alive connections to the API server.
+  TCP keepalive is enabled on those sockets so that a follow log stream
+  or watch that sits idle is not silently dropped by a load balancer.
+  """
   load_kube_config()
-  return client.CoreV1Api()
+  configuration = client.Configuration.get_default_copy()
+  configuration.connection_pool_maxsize = _API_CONNECTION_POOL_MAXSIZE
+  configuration.keep_alive = True
+  configuration.retries = _API_RETRY
+  return client.ApiClient(configuration)
+
+
+@functools.lru_cache(maxsize=1)
+def core_v1():
+  """Return a cached CoreV1Api client on the shared ApiClient."""
+  return client.CoreV1Api(api_client())
+
+
+def wait_for_change(list_fn, obj, namespace, timeout):
+  """Block until the namespaced object *obj* changes, or *timeout*.
+
+  Watches the single object through *list_fn* (e.g.
+  ``BatchV1Api.list_namespaced_job``) so that changes are observed as soon
+  as the API server records them instead of at the next poll tick.  The
+  watch starts from the object's resourceVersion, so one that ends
+  without an event proves the object is unchanged.  Falls back to
+  sleeping for *timeout* if the watch cannot be established.
+
+  Returns:
+      The updated object carried by an ADDED/MODIFIED event, *obj* itself
+      if the watch ended without an event, or None if the caller should
+      read the object again (deletion or watch failure).
+  """
+  timeout = max(0, timeout)
+  name = obj.metadata.name
+  resource_version = obj.metadata.resource_version
+  if not resource_version:
+    time.sleep(timeout)
+    return None
+
+  w = watch.Watch()
+  try:
+    for event in w.stream(
+      list_fn,
+      namespace,
+      field_selector=f"metadata.name={name}",
+      resource_version=resource_version,
+      timeout_seconds=max(1, int(timeout)),
+    ):
+      if event.get("type") in ("ADDED", "MODIFIED"):
+        return event.get("object")
+      return None
+    return obj
+  except (ApiException, urllib3.exceptions.HTTPError) as e:
+    logging.debug("Watch on %s failed, polling instead: %s", name, e)
+    time.sleep(timeout)
+  finally:
+    w.stop()
+  return None
+
+
+def next_poll_interval(interval, changed, poll_interval, max_poll_interval):
+  """Return the watch window to use after one round of `wait_for_change`.
+
+  The window resets to *poll_interval* when the object *changed* and
+  otherwise grows by `POLL_BACKOFF_FACTOR`, capped at *max_poll_interval*
+  (never below *poll_interval*).
+  """
+  if changed:
+    return poll_interval
+  return min(
+    interval * POLL_BACKOFF_FACTOR, max(poll_interval, max_poll_interval)
+  )
 
 
 def list_job_pods(core_v1_client, job_name, namespace):
@@ -360,13 +468,9 @@ def _build_pool_labels(pool: container_v1.NodePool, selector: dict) -> dict:
 
   # Infer accelerator count from machine type using registry.
   # This is robust because it uses the same source of truth as the Pod spec generation.
-  for tpu_spec in accelerators.TPUS.values():
-    for chips, topo_spec in tpu_spec.topologies.items():
-      if topo_spec.machine_type == machine_type:
-        pool_labels[_LABEL_ACCELERATOR_COUNT] = str(
-          chips // topo_spec.num_nodes
-        )
-        break
+  chips_per_node = accelerators.TPU_CHIPS_PER_NODE.get(machine_type)
+  if chips_per_node is not None:
+    pool_labels[_LABEL_ACCELERATOR_COUNT] = str(chips_per_node)
 
   return pool_labels
 
@@ -481,57 +585,70 @@ def _check_image_pull_errors(pod) -> None:
       )
 
 
-def check_pod_scheduling(core_v1_client, job_name, namespace, logged_pending):
-  """Check for pod scheduling and image pull issues, raising helpful errors."""
-  with suppress(ApiException):
-    pods = core_v1_client.list_namespaced_pod(
-      namespace, label_selector=f"job-name={job_name}"
-    )
-    for pod in pods.items:
-      pod_name = pod.metadata.name
-      # Check for image pull failures (can occur in any phase).
-      _check_image_pull_errors(pod)
-
-      if pod.status.phase == "Pending":
-        for condition in pod.status.conditions or []:
-          if condition.type == "PodScheduled" and condition.status == "False":
-            msg = condition.message or ""
-
-            is_insufficient = (
-              f"Insufficient {_RESOURCE_GPU}" in msg
-              or f"Insufficient {_RESOURCE_TPU}" in msg
-            )
-            is_mismatch = (
-              "didn't match Pod's node affinity/selector" in msg
-              or "node selector" in msg.lower()
-            )
-
-            if is_insufficient or is_mismatch:
-              selector = pod.spec.node_selector or {}
-              if not _validate_node_pool_exists(selector):
-                selector_str = (
-                  ", ".join([f"{k}: {v}" for k, v in selector.items()])
-                  if selector
-                  else "None"
-                )
-                raise RuntimeError(
-                  f"No GKE node pool exists with selector '{selector_str}'. "
-                  "Please use 'kinetic pool add' to configure this accelerator."
-                )
-
-              if pod_name not in logged_pending:
-                selector_str = (
-                  ", ".join([f"{k}: {v}" for k, v in selector.items()])
-                  if selector
-                  else "None"
-                )
-                logging.info(
-                  "Pod %s is Pending: %s.\n"
-                  "  Selector: %s\n"
-                  "  Waiting for nodes to become available (this may take a few minutes for new pools or scale-up)\n"
-                  "  Note: If this hangs indefinitely, ensure your GCP project has adequate quota.",
-                  pod_name,
-                  msg.split(". ")[0],
-                  selector_str,
-                )
-                logged_pending.add(pod_name)
+def check_pod_scheduling(
+  core_v1_client, job_name, namespace, logged_pending, pods=None
+):
+  """Check for pod scheduling and image pull issues, raising helpful errors.
+
+  Callers that already listed the job's pods this tick can pass them as
+  *pods* to avoid a second list request.  Otherwise the pods are listed
+  from the API server's watch cache, which is fresh enough for a check
+  that runs on every poll.
+  """
+  if pods is None:
+    try:
+      pods = core_v1_client.list_namespaced_pod(
+        namespace,
+        label_selector=f"job-name={job_name}",
+        resource_version="0",
+      ).items
+    except ApiException:
+      return
+  for pod in pods:
+    pod_name = pod.metadata.name
+    # Check for image pull failures (can occur in any phase).
+    _check_image_pull_errors(pod)
+
+    if pod.status.phase == "Pending":
+      for condition in pod.status.conditions or []:
+        if condition.type == "PodScheduled" and condition.status == "False":
+          msg = condition.message or ""
+
+          is_insufficient = (
+            f"Insufficient {_RESOURCE_GPU}" in msg
+            or f"Insufficient {_RESOURCE_TPU}" in msg
+          )
+          is_mismatch = (
+            "didn't match Pod's node affinity/selector" in msg
+            or "node selector" in msg.lower()
+          )
+
+          if is_insufficient or is_mismatch:
+            selector = pod.spec.node_selector or {}
+            if not _validate_node_pool_exists(selector):
+              selector_str = (
+                ", ".join([f"{k}: {v}" for k, v in selector.items()])
+                if selector
+                else "None"
+              )
+              raise RuntimeError(
+                f"No GKE node pool exists with selector '{selector_str}'. "
+                "Please use 'kinetic pool add' to configure this accelerator."
+              )
+
+            if pod_name not in logged_pending:
+              selector_str = (
+                ", ".join([f"{k}: {v}" for k, v in selector.items()])
+                if selector
+                else "None"
+              )
+              logging.info(
+                "Pod %s is Pending: %s.\n"
+                "  Selector: %s\n"
+                "  Waiting for nodes to become available (this may take a few minutes for new pools or scale-up)\n"
+                "  Note: If this hangs indefinitely, ensure your GCP project has adequate quota.",
+                pod_name,
+                msg.split(". ")[0],
+                selector_str,
+              )
+              logged_pending.add(pod_name)
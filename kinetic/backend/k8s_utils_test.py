@@ -1,5 +1,7 @@
 """Tests for kinetic.backend.k8s_utils — shared K8s utilities."""
 
+import socket
+from types import SimpleNamespace
 from unittest import mock
 from unittest.mock import MagicMock
 
@@ -14,74 +16,113 @@ from kinetic.backend.k8s_utils import (
   _check_image_pull_errors,
   _check_node_pool_exists_cached,
   _pod_exit_summary,
+  accelerator_pod_fields,
+  api_client,
   build_gcs_fuse_v1_volumes,
   build_gcs_fuse_volumes,
   check_pod_scheduling,
   collect_pod_failure_details,
+  core_v1,
   load_kube_config,
+  next_poll_interval,
   parse_accelerator,
+  wait_for_change,
 )
+from kinetic.core import accelerators
 
+_GPU_TOLERATION = {
+  "key": "nvidia.com/gpu",
+  "operator": "Exists",
+  "effect": "NoSchedule",
+}
+_TPU_TOLERATION = {
+  "key": "google.com/tpu",
+  "operator": "Exists",
+  "effect": "NoSchedule",
+}
 
-class TestParseAccelerator(absltest.TestCase):
-  def test_cpu(self):
-    result = parse_accelerator("cpu")
-    self.assertEqual(result["node_selector"], {})
-    self.assertEqual(result["resource_limits"], {})
-    self.assertEqual(result["resource_requests"], {})
-    self.assertEqual(result["tolerations"], [])
-    self.assertEqual(result["jax_platform"], "cpu")
 
-  def test_gpu_l4(self):
-    result = parse_accelerator("l4")
-    self.assertEqual(
-      result["node_selector"],
-      {"cloud.google.com/gke-accelerator": "nvidia-l4"},
-    )
-    self.assertEqual(result["resource_limits"], {"nvidia.com/gpu": "1"})
-    self.assertEqual(result["resource_requests"], {"nvidia.com/gpu": "1"})
-    self.assertEqual(result["jax_platform"], "gpu")
-    self.assertLen(result["tolerations"], 1)
-    self.assertEqual(result["tolerations"][0]["key"], "nvidia.com/gpu")
-    self.assertEqual(result["tolerations"][0]["operator"], "Exists")
-    self.assertEqual(result["tolerations"][0]["effect"], "NoSchedule")
-
-  def test_gpu_a100x4(self):
-    result = parse_accelerator("a100x4")
-    self.assertEqual(result["resource_limits"], {"nvidia.com/gpu": "4"})
-    self.assertEqual(result["resource_requests"], {"nvidia.com/gpu": "4"})
-
-  def test_tpu_v3_8(self):
-    result = parse_accelerator("v3-4")
-    self.assertIn(
-      "cloud.google.com/gke-tpu-accelerator", result["node_selector"]
-    )
-    self.assertIn("cloud.google.com/gke-tpu-topology", result["node_selector"])
-    self.assertEqual(result["resource_limits"], {"google.com/tpu": "4"})
-    self.assertEqual(result["resource_requests"], {"google.com/tpu": "4"})
-    self.assertEqual(result["jax_platform"], "tpu")
-    self.assertLen(result["tolerations"], 1)
-    self.assertEqual(result["tolerations"][0]["key"], "google.com/tpu")
-
-  def test_tpu_v3_16_multi_node(self):
-    # v3-16 has 4 nodes and 16 total chips -> 4 chips per node
-    result = parse_accelerator("v3-16")
-    self.assertEqual(result["resource_limits"], {"google.com/tpu": "4"})
-    self.assertEqual(result["resource_requests"], {"google.com/tpu": "4"})
-    self.assertEqual(
-      result["node_selector"]["cloud.google.com/gke-tpu-topology"], "4x4"
-    )
-
-  def test_tpu_v5litepod_4(self):
-    result = parse_accelerator("v5litepod-4")
-    self.assertEqual(
-      result["node_selector"],
-      {
+class TestParseAccelerator(parameterized.TestCase):
+  @parameterized.named_parameters(
+    dict(
+      testcase_name="cpu",
+      accel="cpu",
+      node_selector={},
+      resources={},
+      tolerations=[],
+      jax_platform="cpu",
+    ),
+    dict(
+      testcase_name="gpu_l4",
+      accel="l4",
+      node_selector={"cloud.google.com/gke-accelerator": "nvidia-l4"},
+      resources={"nvidia.com/gpu": "1"},
+      tolerations=[_GPU_TOLERATION],
+      jax_platform="gpu",
+    ),
+    dict(
+      testcase_name="gpu_a100x4",
+      accel="a100x4",
+      node_selector={"cloud.google.com/gke-accelerator": "nvidia-tesla-a100"},
+      resources={"nvidia.com/gpu": "4"},
+      tolerations=[_GPU_TOLERATION],
+      jax_platform="gpu",
+    ),
+    dict(
+      testcase_name="tpu_v3_4",
+      accel="v3-4",
+      node_selector={
+        "cloud.google.com/gke-tpu-accelerator": "tpu-v3-podslice",
+        "cloud.google.com/gke-tpu-topology": "2x2",
+      },
+      resources={"google.com/tpu": "4"},
+      tolerations=[_TPU_TOLERATION],
+      jax_platform="tpu",
+    ),
+    # v3-16 has 4 nodes and 16 total chips -> 4 chips per node.
+    dict(
+      testcase_name="tpu_v3_16_multi_node",
+      accel="v3-16",
+      node_selector={
+        "cloud.google.com/gke-tpu-accelerator": "tpu-v3-podslice",
+        "cloud.google.com/gke-tpu-topology": "4x4",
+      },
+      resources={"google.com/tpu": "4"},
+      tolerations=[_TPU_TOLERATION],
+      jax_platform="tpu",
+    ),
+    dict(
+      testcase_name="tpu_v5litepod_4",
+      accel="v5litepod-4",
+      node_selector={
         "cloud.google.com/gke-tpu-accelerator": "tpu-v5-lite-podslice",
         "cloud.google.com/gke-tpu-topology": "2x2",
       },
-    )
-    self.assertEqual(result["resource_limits"], {"google.com/tpu": "4"})
+      resources={"google.com/tpu": "4"},
+      tolerations=[_TPU_TOLERATION],
+      jax_platform="tpu",
+    ),
+  )
+  def test_pod_fields(
+    self, accel, node_selector, resources, tolerations, jax_platform
+  ):
+    result = parse_accelerator(accel)
+    self.assertEqual(result["node_selector"], node_selector)
+    self.assertEqual(result["resource_limits"], resources)
+    self.assertEqual(result["resource_requests"], resources)
+    self.assertEqual(result["tolerations"], tolerations)
+    self.assertEqual(result["jax_platform"], jax_platform)
+
+  def test_pod_fields_from_parsed_config(self):
+    for accel in ("cpu", "a100x4", "v5litepod-8:spot"):
+      parsed = accelerators.parse_accelerator(accel)
+      self.assertEqual(accelerator_pod_fields(parsed), parse_accelerator(accel))
+
+  def test_pod_fields_are_not_shared_between_calls(self):
+    parsed = accelerators.parse_accelerator("l4")
+    first = accelerator_pod_fields(parsed)
+    first["node_selector"]["extra"] = "x"
+    self.assertNotIn("extra", accelerator_pod_fields(parsed)["node_selector"])
 
   def test_spot_gpu(self):
     result = parse_accelerator("l4:spot")
@@ -134,6 +175,45 @@ class TestLoadKubeConfig(absltest.TestCase):
       load_kube_config()
 
 
+class TestApiClient(absltest.TestCase):
+  def setUp(self):
+    super().setUp()
+    for fn in (load_kube_config, api_client, core_v1):
+      fn.cache_clear()
+      self.addCleanup(fn.cache_clear)
+
+  def test_typed_clients_share_one_api_client(self):
+    with mock.patch(
+      "kinetic.backend.k8s_utils.config.load_incluster_config"
+    ) as mock_load:
+      shared = api_client()
+      self.assertIs(api_client(), shared)
+      self.assertIs(core_v1().api_client, shared)
+
+    mock_load.assert_called_once()
+    self.assertEqual(shared.configuration.connection_pool_maxsize, 16)
+
+  def test_retries_throttled_and_transient_errors(self):
+    with mock.patch("kinetic.backend.k8s_utils.config.load_incluster_config"):
+      retries = api_client().rest_client.pool_manager.connection_pool_kw[
+        "retries"
+      ]
+
+    self.assertTrue(retries.is_retry("GET", 429))
+    self.assertTrue(retries.is_retry("GET", 503))
+    self.assertFalse(retries.is_retry("POST", 503))
+    self.assertFalse(retries.is_retry("GET", 404))
+    self.assertFalse(retries.raise_on_status)
+
+  def test_sockets_use_tcp_keepalive(self):
+    with mock.patch("kinetic.backend.k8s_utils.config.load_incluster_config"):
+      pool_kw = api_client().rest_client.pool_manager.connection_pool_kw
+
+    self.assertIn(
+      (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1), pool_kw["socket_options"]
+    )
+
+
 class TestCheckNodePoolExistsCached(absltest.TestCase):
   def setUp(self):
     super().setUp()
@@ -480,18 +560,117 @@ class TestCollectPodFailureDetails(absltest.TestCase):
     self.assertEqual(result, "")
 
 
+class TestWaitForChange(absltest.TestCase):
+  def setUp(self):
+    super().setUp()
+    self.mock_watch = MagicMock()
+    self.enterContext(
+      mock.patch(
+        "kinetic.backend.k8s_utils.watch.Watch",
+        return_value=self.mock_watch,
+      )
+    )
+    self.mock_sleep = self.enterContext(
+      mock.patch("kinetic.backend.k8s_utils.time.sleep")
+    )
+    self.list_fn = MagicMock()
+
+  def _make_obj(self, resource_version="42"):
+    return SimpleNamespace(
+      metadata=SimpleNamespace(name="obj-0", resource_version=resource_version)
+    )
+
+  def test_returns_object_from_first_event(self):
+    updated = MagicMock()
+    self.mock_watch.stream.return_value = iter(
+      [{"type": "MODIFIED", "object": updated}]
+    )
+
+    result = wait_for_change(self.list_fn, self._make_obj(), "default", 10)
+
+    self.assertIs(result, updated)
+    self.mock_watch.stream.assert_called_once_with(
+      self.list_fn,
+      "default",
+      field_selector="metadata.name=obj-0",
+      resource_version="42",
+      timeout_seconds=10,
+    )
+    self.mock_watch.stop.assert_called_once()
+    self.mock_sleep.assert_not_called()
+
+  def test_deleted_event_returns_none(self):
+    self.mock_watch.stream.return_value = iter(
+      [{"type": "DELETED", "object": MagicMock()}]
+    )
+
+    self.assertIsNone(
+      wait_for_change(self.list_fn, self._make_obj(), "default", 10)
+    )
+
+  def test_returns_same_object_when_watch_times_out(self):
+    self.mock_watch.stream.return_value = iter([])
+    obj = self._make_obj()
+
+    result = wait_for_change(self.list_fn, obj, "default", 10)
+
+    self.assertIs(result, obj)
+    self.mock_sleep.assert_not_called()
+
+  def test_falls_back_to_sleep_on_watch_error(self):
+    self.mock_watch.stream.side_effect = ApiException(status=410)
+
+    result = wait_for_change(self.list_fn, self._make_obj(), "default", 10)
+
+    self.assertIsNone(result)
+    self.mock_sleep.assert_called_once_with(10)
+    self.mock_watch.stop.assert_called_once()
+
+  def test_sleeps_without_resource_version(self):
+    wait_for_change(self.list_fn, self._make_obj(None), "default", 10)
+
+    self.mock_watch.stream.assert_not_called()
+    self.mock_sleep.assert_called_once_with(10)
+
+  def test_negative_timeout_is_clamped(self):
+    wait_for_change(self.list_fn, self._make_obj(None), "default", -2)
+
+    self.mock_sleep.assert_called_once_with(0)
+
+
+class TestNextPollInterval(parameterized.TestCase):
+  @parameterized.named_parameters(
+    ("unchanged_doubles", 5, False, 10),
+    ("unchanged_capped", 10, False, 12),
+    ("changed_resets", 12, True, 5),
+  )
+  def test_next_interval(self, interval, changed, expected):
+    self.assertEqual(next_poll_interval(interval, changed, 5, 12), expected)
+
+  def test_never_below_poll_interval(self):
+    self.assertEqual(next_poll_interval(20, False, 20, 12), 20)
+
+
 class TestCheckPodScheduling(parameterized.TestCase):
+  def _make_pod(self, phase, conditions=None, node_selector=None):
+    return SimpleNamespace(
+      metadata=SimpleNamespace(name="pod-1"),
+      spec=SimpleNamespace(node_selector=node_selector),
+      status=SimpleNamespace(
+        phase=phase,
+        conditions=conditions,
+        container_statuses=None,
+        init_container_statuses=None,
+      ),
+    )
+
   def _make_pending_pod(self, message, node_selector=None):
-    pod = MagicMock()
-    pod.status.phase = "Pending"
-    pod.status.container_statuses = None
-    pod.spec.node_selector = node_selector
-    condition = MagicMock()
-    condition.type = "PodScheduled"
-    condition.status = "False"
-    condition.message = message
-    pod.status.conditions = [condition]
-    return pod
+    condition = SimpleNamespace(
+      type="PodScheduled", status="False", message=message
+    )
+    return self._make_pod(
+      "Pending", conditions=[condition], node_selector=node_selector
+    )
 
   @parameterized.named_parameters(
     dict(
@@ -545,11 +724,19 @@ class TestCheckPodScheduling(parameterized.TestCase):
     with self.assertRaisesRegex(RuntimeError, error_match):
       check_pod_scheduling(mock_core, "job-1", "default", set())
 
+  def test_lists_pods_from_watch_cache(self):
+    mock_core = MagicMock()
+    mock_core.list_namespaced_pod.return_value.items = []
+
+    check_pod_scheduling(mock_core, "job-1", "default", set())
+
+    mock_core.list_namespaced_pod.assert_called_once_with(
+      "default", label_selector="job-name=job-1", resource_version="0"
+    )
+
   def test_running_pod_no_error(self):
     mock_core = MagicMock()
-    pod = MagicMock()
-    pod.status.phase = "Running"
-    pod.status.conditions = []
+    pod = self._make_pod("Running", conditions=[])
     mock_core.list_namespaced_pod.return_value.items = [pod]
 
     check_pod_scheduling(
@@ -558,10 +745,7 @@ class TestCheckPodScheduling(parameterized.TestCase):
 
   def test_pending_no_conditions(self):
     mock_core = MagicMock()
-    pod = MagicMock()
-    pod.status.phase = "Pending"
-    pod.status.conditions = None
-    pod.status.container_statuses = None
+    pod = self._make_pod("Pending")
     mock_core.list_namespaced_pod.return_value.items = [pod]
 
     check_pod_scheduling(
@@ -17,6 +17,13 @@ from kinetic.cli.output import LiveOutputPanel
 _MAX_DISPLAY_LINES = 25
 
 
+def _decode_line(line):
+  """Decode one raw log line, keeping only the text after its last CR."""
+  if b"\r" in line:
+    line = line.rsplit(b"\r", 1)[-1]
+  return line.decode("utf-8", errors="replace")
+
+
 def _stream_pod_logs(core_v1, pod_name, namespace):
   """Stream pod logs to stdout. Designed to run in a daemon thread.
 
@@ -41,26 +48,34 @@ def _stream_pod_logs(core_v1, pod_name, namespace):
       _preload_content=False,
     )
     title = f"Remote logs \u2022 {pod_name}"
+    # Each stream gets its own Console: Rich allows one Live display per
+    # Console, and several jobs may stream logs concurrently.
     with LiveOutputPanel(
       title,
       max_lines=_MAX_DISPLAY_LINES,
       target_console=Console(),
       show_subtitle=False,
     ) as panel:
-      buffer = ""
+      # Split on raw bytes and decode only completed lines: b"\n" and
+      # b"\r" never occur inside a multi-byte UTF-8 sequence, so a
+      # character that straddles a chunk boundary stays intact, and only
+      # one str is allocated per displayed line.  Only the new chunk is
+      # scanned for line breaks, and a pending line is cut back to its
+      # last carriage return (all that would be displayed), so long runs
+      # of progress bar updates cost linear time and bounded memory.
+      buffer = b""
       for chunk in resp.stream(decode_content=True):
-        buffer += chunk.decode("utf-8", errors="replace")
-        while "\n" in buffer:
-          line, buffer = buffer.split("\n", 1)
-          if "\r" in line:
-            line = line.rsplit("\r", 1)[-1]
-          panel.on_output(line)
+        if b"\n" not in chunk:
+          buffer += chunk
+          if b"\r" in chunk:
+            buffer = buffer[buffer.rindex(b"\r") :]
+          continue
+        *lines, buffer = (buffer + chunk).split(b"\n")
+        for line in lines:
+          panel.on_output(_decode_line(line))
       # Flush remaining partial line
       if buffer.strip():
-        line = buffer
-        if "\r" in line:
-          line = line.rsplit("\r", 1)[-1]
-        panel.on_output(line)
+        panel.on_output(_decode_line(buffer))
   except ApiException:
     pass  # Pod deleted or not found
   except urllib3.exceptions.ProtocolError:
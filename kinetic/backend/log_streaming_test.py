@@ -55,6 +55,59 @@ class TestStreamPodLogs(absltest.TestCase):
     lines = [call[0][0] for call in mock_panel.on_output.call_args_list]
     self.assertEqual(lines, ["hello", "world"])
 
+  def test_multibyte_character_split_across_chunks(self):
+    mock_core = MagicMock()
+    encoded = "loss ✓\nnext\n".encode()
+    split = encoded.index("✓".encode()) + 1
+    mock_core.read_namespaced_pod_log.return_value = self._make_mock_resp(
+      [encoded[:split], encoded[split:]]
+    )
+
+    with mock.patch(
+      "kinetic.backend.log_streaming.LiveOutputPanel"
+    ) as mock_panel_cls:
+      mock_panel = MagicMock()
+      mock_panel_cls.return_value.__enter__ = MagicMock(return_value=mock_panel)
+      mock_panel_cls.return_value.__exit__ = MagicMock(return_value=False)
+      _stream_pod_logs(mock_core, "pod-1", "default")
+
+    lines = [call[0][0] for call in mock_panel.on_output.call_args_list]
+    self.assertEqual(lines, ["loss ✓", "next"])
+
+  def test_invalid_utf8_is_confined_to_its_line(self):
+    mock_core = MagicMock()
+    mock_core.read_namespaced_pod_log.return_value = self._make_mock_resp(
+      [b"bad \xff\nok\n"]
+    )
+
+    with mock.patch(
+      "kinetic.backend.log_streaming.LiveOutputPanel"
+    ) as mock_panel_cls:
+      mock_panel = MagicMock()
+      mock_panel_cls.return_value.__enter__ = MagicMock(return_value=mock_panel)
+      mock_panel_cls.return_value.__exit__ = MagicMock(return_value=False)
+      _stream_pod_logs(mock_core, "pod-1", "default")
+
+    lines = [call[0][0] for call in mock_panel.on_output.call_args_list]
+    self.assertEqual(lines, ["bad \ufffd", "ok"])
+
+  def test_progress_updates_across_chunks_show_last_segment(self):
+    mock_core = MagicMock()
+    mock_core.read_namespaced_pod_log.return_value = self._make_mock_resp(
+      [b"1/10\r", b"2/10\r", b"3/1", b"0\n"]
+    )
+
+    with mock.patch(
+      "kinetic.backend.log_streaming.LiveOutputPanel"
+    ) as mock_panel_cls:
+      mock_panel = MagicMock()
+      mock_panel_cls.return_value.__enter__ = MagicMock(return_value=mock_panel)
+      mock_panel_cls.return_value.__exit__ = MagicMock(return_value=False)
+      _stream_pod_logs(mock_core, "pod-1", "default")
+
+    lines = [call[0][0] for call in mock_panel.on_output.call_args_list]
+    self.assertEqual(lines, ["3/10"])
+
   def test_handles_carriage_returns(self):
     mock_core = MagicMock()
     # "1/10\r2/10\r3/10\n"
@@ -2,6 +2,7 @@
 
 import copy
 import functools
+import random
 import time
 
 from absl import logging
@@ -20,19 +21,23 @@ LWS_GROUP = "leaderworkerset.x-k8s.io"
 LWS_VERSION = "v1"
 LWS_PLURAL = "leaderworkersets"
 
+# Until the leader pod exists, wait_for_job polls for it quickly at first
+# and then backs off towards poll_interval.  Each sleep is shortened by up
+# to _POLL_JITTER so concurrent waiters do not poll in lockstep.
+_POLL_INITIAL_DELAY_SECONDS = 0.5
+_POLL_JITTER = 0.2
+
 
 @functools.lru_cache(maxsize=1)
 def _custom_api():
-  """Return a cached CustomObjectsApi client, loading kubeconfig on first call."""
-  k8s_utils.load_kube_config()
-  return client.CustomObjectsApi()
+  """Return a cached CustomObjectsApi client on the shared ApiClient."""
+  return client.CustomObjectsApi(k8s_utils.api_client())
 
 
 @functools.lru_cache(maxsize=1)
 def _apis_api():
-  """Return a cached ApisApi client, loading kubeconfig on first call."""
-  k8s_utils.load_kube_config()
-  return client.ApisApi()
+  """Return a cached ApisApi client on the shared ApiClient."""
+  return client.ApisApi(k8s_utils.api_client())
 
 
 def _get_job_name(job_id: str) -> str:
@@ -40,17 +45,26 @@ def _get_job_name(job_id: str) -> str:
   return f"keras-pathways-{job_id}"
 
 
+@functools.lru_cache(maxsize=4)
+def _discover_api_version(group):
+  """Return the preferred version of API *group* served by the cluster.
+
+  Installed API versions do not change while a process runs, so successful
+  lookups are cached.  Failures raise and are therefore retried next time.
+
+  Raises:
+      ApiException: If discovery fails or the group is not served.
+  """
+  for api_group in _apis_api().get_api_versions().groups:
+    if api_group.name == group:
+      return api_group.preferred_version.version
+  raise ApiException(status=404, reason=f"API group {group} not found")
+
+
 def _get_lws_version(group=LWS_GROUP):
   """Get the preferred version for the LeaderWorkerSet API."""
-  api = _apis_api()
   try:
-    api_groups = api.get_api_versions().groups
-    for api_group in api_groups:
-      if api_group.name == group:
-        return api_group.preferred_version.version
-
-    # If we didn't find the group, raise ApiException to fallback
-    raise ApiException(status=404, reason=f"API group {group} not found")
+    return _discover_api_version(group)
   except ApiException:
     logging.warning(
       "Failed to retrieve LWS API version from cluster. Defaulting to '%s'",
@@ -95,7 +109,7 @@ def submit_pathways_job(
   lws_version = _get_lws_version()
 
   parsed_config = accelerators.parse_accelerator(accelerator, spot=spot)
-  accel_config = k8s_utils.parse_accelerator(accelerator, spot=spot)
+  accel_config = k8s_utils.accelerator_pod_fields(parsed_config)
   job_name = _get_job_name(job_id)
 
   if (
@@ -132,7 +146,7 @@ def submit_pathways_job(
       plural=LWS_PLURAL,
       body=lws_manifest,
     )
-    logging.info(f"Submitted Pathways job (LWS): {job_name}")
+    logging.info("Submitted Pathways job (LWS): %s", job_name)
     logging.info(
       "View job with: kubectl get %s %s -n %s", LWS_PLURAL, job_name, namespace
     )
@@ -162,34 +176,52 @@ def _raise_with_details(base_msg, core_v1, job_name, namespace):
   raise RuntimeError(msg)
 
 
-def wait_for_job(job_id, namespace="default", timeout=3600, poll_interval=10):
-  """Wait for Pathways Job (LeaderWorkerSet) to complete."""
+def wait_for_job(
+  job_id,
+  namespace="default",
+  timeout=3600,
+  poll_interval=10,
+  max_poll_interval=k8s_utils.MAX_POLL_INTERVAL_SECONDS,
+):
+  """Wait for Pathways Job (LeaderWorkerSet) to complete.
+
+  Once the leader pod exists it is watched, so phase changes are seen as
+  soon as the API server records them.  Status is re-checked every
+  *poll_interval* seconds, backing off to *max_poll_interval* while the
+  pod is unchanged.
+  """
   core_v1 = k8s_utils.core_v1()
 
   job_name = _get_job_name(job_id)
-  start_time = time.time()
+  deadline = time.monotonic() + timeout
   logged_running = False
 
   # The leader pod is suffixed with '-0' by LWS
   leader_pod_name = _get_leader_pod_name(job_name)
 
   logged_pending = set()
+  delay = min(poll_interval, _POLL_INITIAL_DELAY_SECONDS)
+  interval = poll_interval
+
+  # Leader pod delivered by the last watch event, if any; saves re-reading
+  # the pod the watch has just sent.
+  pod = None
   with LogStreamer(core_v1, namespace) as streamer:
     while True:
-      elapsed = time.time() - start_time
-      if elapsed > timeout:
+      if time.monotonic() >= deadline:
         raise RuntimeError(
           f"Pathways job {job_name} timed out after {timeout}s"
         )
 
       try:
-        pod = core_v1.read_namespaced_pod(leader_pod_name, namespace)
+        if pod is None:
+          pod = core_v1.read_namespaced_pod(leader_pod_name, namespace)
         if not logged_running:
-          logging.info(f"Found pod: {leader_pod_name}")
+          logging.info("Found pod: %s", leader_pod_name)
           logged_running = True
 
         if pod.status.phase == "Succeeded":
-          logging.info(f"[REMOTE] Job {job_name} completed successfully")
+          logging.info("[REMOTE] Job %s completed successfully", job_name)
           return "success"
 
         if pod.status.phase == "Failed":
@@ -224,7 +256,7 @@ def wait_for_job(job_id, namespace="default", timeout=3600, poll_interval=10):
         # Check current state
         if container_status.state.terminated:
           if container_status.state.terminated.exit_code == 0:
-            logging.info(f"[REMOTE] Job {job_name} completed successfully")
+            logging.info("[REMOTE] Job %s completed successfully", job_name)
             return "success"
           else:
             _raise_with_details(
@@ -238,7 +270,7 @@ def wait_for_job(job_id, namespace="default", timeout=3600, poll_interval=10):
         if container_status.last_state.terminated:
           if container_status.last_state.terminated.exit_code == 0:
             logging.info(
-              f"[REMOTE] Job {job_name} completed successfully (restarted)"
+              "[REMOTE] Job %s completed successfully (restarted)", job_name
             )
             return "success"
           else:
@@ -249,7 +281,25 @@ def wait_for_job(job_id, namespace="default", timeout=3600, poll_interval=10):
               namespace,
             )
 
-      time.sleep(poll_interval)
+      # The reads above may have run past the deadline; report the
+      # timeout at the top of the loop rather than waiting again.
+      remaining = deadline - time.monotonic()
+      if remaining <= 0:
+        continue
+      if pod is not None:
+        changed = k8s_utils.wait_for_change(
+          core_v1.list_namespaced_pod,
+          pod,
+          namespace,
+          min(interval, remaining),
+        )
+        interval = k8s_utils.next_poll_interval(
+          interval, changed is not pod, poll_interval, max_poll_interval
+        )
+        pod = changed
+      else:
+        time.sleep(min(delay * random.uniform(1 - _POLL_JITTER, 1), remaining))
+        delay = min(poll_interval, delay * k8s_utils.POLL_BACKOFF_FACTOR)
 
 
 def cleanup_job(
@@ -257,7 +307,10 @@ def cleanup_job(
 ):
   """Delete LeaderWorkerSet.
 
-  Blocks until the API confirms the resource is gone (404).
+  Blocks until the API confirms the resource is gone (404).  Deletion uses
+  background propagation: the LWS is removed right away and the garbage
+  collector reaps its pods afterwards, so cleanup does not wait for every
+  pod of a multi-host slice to terminate.
 
   Args:
       job_name: Name of the LeaderWorkerSet
@@ -275,8 +328,9 @@ def cleanup_job(
       namespace=namespace,
       plural=LWS_PLURAL,
       name=job_name,
+      body=client.V1DeleteOptions(propagation_policy="Background"),
     )
-    logging.info(f"Deleted LeaderWorkerSet: {job_name}")
+    logging.info("Deleted LeaderWorkerSet: %s", job_name)
   except ApiException as e:
     if e.status == 404:
       # Job already deleted
@@ -553,7 +607,7 @@ def _create_lws_spec(
       {"containerPort": DEBUGPY_PORT, "name": "debugpy"},
     ]
 
-    worker_template = copy.deepcopy(pod_template)
+    worker_template = pod_template
     worker_container = worker_template["spec"]["containers"][0]
     worker_container["env"].extend(
       [
@@ -565,9 +619,19 @@ def _create_lws_spec(
       ]
     )
   else:
-    leader_template = pod_template
+    # LWS applies the worker template to the leader when no leader
+    # template is given, so identical pods are sent only once.
+    leader_template = None
     worker_template = pod_template
 
+  leader_worker_template = {
+    "size": num_workers + 1,  # 1 leader + N workers
+    "restartPolicy": "RecreateGroupOnPodRestart",
+    "workerTemplate": worker_template,
+  }
+  if leader_template is not None:
+    leader_worker_template["leaderTemplate"] = leader_template
+
   return {
     "apiVersion": f"{LWS_GROUP}/{version}",
     "kind": "LeaderWorkerSet",
@@ -578,12 +642,7 @@ def _create_lws_spec(
     },
     "spec": {
       "replicas": 1,
-      "leaderWorkerTemplate": {
-        "size": num_workers + 1,  # 1 leader + N workers
-        "restartPolicy": "RecreateGroupOnPodRestart",
-        "leaderTemplate": leader_template,
-        "workerTemplate": worker_template,
-      },
+      "leaderWorkerTemplate": leader_worker_template,
     },
   }
 
@@ -1,5 +1,6 @@
 """Tests for kinetic.backend.pathways_client — LWS job submission and monitoring."""
 
+from types import SimpleNamespace
 from unittest import mock
 from unittest.mock import MagicMock
 
@@ -15,6 +16,7 @@ from kinetic.backend.pathways_client import (
   LWS_PLURAL,
   LWS_VERSION,
   _create_lws_spec,
+  _discover_api_version,
   _get_lws_version,
   cleanup_job,
   get_job_logs,
@@ -26,12 +28,18 @@ from kinetic.backend.pathways_client import (
 from kinetic.backend.pathways_client import (
   list_jobs as list_pathways_jobs,
 )
+from kinetic.core import accelerators
 from kinetic.job_status import JobStatus
 
 _MODULE = "kinetic.backend.pathways_client"
 
 
 class TestGetLwsVersion(absltest.TestCase):
+  def setUp(self):
+    super().setUp()
+    _discover_api_version.cache_clear()
+    self.addCleanup(_discover_api_version.cache_clear)
+
   def test_returns_preferred_version(self):
     """Test that if the LWS API group is found, we return its preferred version."""
     mock_api = MagicMock()
@@ -63,6 +71,33 @@ class TestGetLwsVersion(absltest.TestCase):
     with mock.patch(f"{_MODULE}._apis_api", return_value=mock_api):
       self.assertEqual(_get_lws_version(), LWS_VERSION)
 
+  def test_discovered_version_is_cached(self):
+    mock_api = MagicMock()
+    group = MagicMock()
+    group.name = LWS_GROUP
+    group.preferred_version.version = "v2"
+    mock_api.get_api_versions.return_value.groups = [group]
+
+    with mock.patch(f"{_MODULE}._apis_api", return_value=mock_api):
+      self.assertEqual(_get_lws_version(), "v2")
+      self.assertEqual(_get_lws_version(), "v2")
+
+    mock_api.get_api_versions.assert_called_once()
+
+  def test_failure_is_not_cached(self):
+    mock_api = MagicMock()
+    group = MagicMock()
+    group.name = LWS_GROUP
+    group.preferred_version.version = "v2"
+    mock_api.get_api_versions.side_effect = [
+      ApiException(status=500, reason="Server Error"),
+      MagicMock(groups=[group]),
+    ]
+
+    with mock.patch(f"{_MODULE}._apis_api", return_value=mock_api):
+      self.assertEqual(_get_lws_version(), LWS_VERSION)
+      self.assertEqual(_get_lws_version(), "v2")
+
 
 class TestCreateLwsSpec(absltest.TestCase):
   def _make_tpu_accel_config(self):
@@ -113,7 +148,7 @@ class TestCreateLwsSpec(absltest.TestCase):
     self.assertEqual(spec["spec"]["replicas"], 1)
     self.assertEqual(spec["spec"]["leaderWorkerTemplate"]["size"], 4)
     # Container.
-    container = spec["spec"]["leaderWorkerTemplate"]["leaderTemplate"]["spec"][
+    container = spec["spec"]["leaderWorkerTemplate"]["workerTemplate"]["spec"][
       "containers"
     ][0]
     self.assertEqual(container["name"], "kinetic-worker")
@@ -140,7 +175,7 @@ class TestCreateLwsSpec(absltest.TestCase):
       bucket_name="bkt",
       num_workers=3,
     )
-    container = spec["spec"]["leaderWorkerTemplate"]["leaderTemplate"]["spec"][
+    container = spec["spec"]["leaderWorkerTemplate"]["workerTemplate"]["spec"][
       "containers"
     ][0]
     env = {e["name"]: e["value"] for e in container["env"]}
@@ -168,7 +203,7 @@ class TestCreateLwsSpec(absltest.TestCase):
     )
 
     spec = self._make_spec(accel_config=accel_config)
-    pod_spec = spec["spec"]["leaderWorkerTemplate"]["leaderTemplate"]["spec"]
+    pod_spec = spec["spec"]["leaderWorkerTemplate"]["workerTemplate"]["spec"]
 
     self.assertEqual(
       pod_spec["nodeSelector"]["cloud.google.com/gke-spot"], "true"
@@ -184,10 +219,10 @@ class TestCreateLwsSpec(absltest.TestCase):
   def test_tpu_accel_config(self):
     """Test resources, tolerations, and node selector for TPU config."""
     spec = self._make_spec(accel_config=self._make_tpu_accel_config())
-    container = spec["spec"]["leaderWorkerTemplate"]["leaderTemplate"]["spec"][
+    container = spec["spec"]["leaderWorkerTemplate"]["workerTemplate"]["spec"][
       "containers"
     ][0]
-    pod_spec = spec["spec"]["leaderWorkerTemplate"]["leaderTemplate"]["spec"]
+    pod_spec = spec["spec"]["leaderWorkerTemplate"]["workerTemplate"]["spec"]
     # Resources.
     self.assertEqual(container["resources"]["limits"], {"google.com/tpu": "4"})
     self.assertEqual(
@@ -206,13 +241,13 @@ class TestCreateLwsSpec(absltest.TestCase):
   def test_cpu_accel_config(self):
     """Test that tolerations and node selector are omitted for CPU config."""
     spec = self._make_spec(accel_config=self._make_cpu_accel_config())
-    pod_spec = spec["spec"]["leaderWorkerTemplate"]["leaderTemplate"]["spec"]
+    pod_spec = spec["spec"]["leaderWorkerTemplate"]["workerTemplate"]["spec"]
     self.assertNotIn("tolerations", pod_spec)
     self.assertNotIn("nodeSelector", pod_spec)
 
   def test_pod_labels(self):
     spec = self._make_spec(job_name="my-job", job_id="j1")
-    labels = spec["spec"]["leaderWorkerTemplate"]["leaderTemplate"]["metadata"][
+    labels = spec["spec"]["leaderWorkerTemplate"]["workerTemplate"]["metadata"][
       "labels"
     ]
     self.assertEqual(labels["app"], "kinetic-pathways")
@@ -226,7 +261,7 @@ class TestCreateLwsSpec(absltest.TestCase):
   def test_zero_workers(self):
     spec = self._make_spec(num_workers=0)
     self.assertEqual(spec["spec"]["leaderWorkerTemplate"]["size"], 1)
-    container = spec["spec"]["leaderWorkerTemplate"]["leaderTemplate"]["spec"][
+    container = spec["spec"]["leaderWorkerTemplate"]["workerTemplate"]["spec"][
       "containers"
     ][0]
     env = {e["name"]: e["value"] for e in container["env"]}
@@ -235,7 +270,7 @@ class TestCreateLwsSpec(absltest.TestCase):
   def test_multiple_workers(self):
     spec = self._make_spec(num_workers=7)
     self.assertEqual(spec["spec"]["leaderWorkerTemplate"]["size"], 8)
-    container = spec["spec"]["leaderWorkerTemplate"]["leaderTemplate"]["spec"][
+    container = spec["spec"]["leaderWorkerTemplate"]["workerTemplate"]["spec"][
       "containers"
     ][0]
     env = {e["name"]: e["value"] for e in container["env"]}
@@ -243,7 +278,7 @@ class TestCreateLwsSpec(absltest.TestCase):
 
   def test_no_fuse_no_volumes_or_annotations(self):
     spec = self._make_spec()
-    pod = spec["spec"]["leaderWorkerTemplate"]["leaderTemplate"]
+    pod = spec["spec"]["leaderWorkerTemplate"]["workerTemplate"]
     self.assertNotIn("annotations", pod["metadata"])
     self.assertNotIn("volumes", pod["spec"])
     container = pod["spec"]["containers"][0]
@@ -259,7 +294,7 @@ class TestCreateLwsSpec(absltest.TestCase):
       }
     ]
     spec = self._make_spec(fuse_volume_specs=fuse_specs)
-    pod = spec["spec"]["leaderWorkerTemplate"]["leaderTemplate"]
+    pod = spec["spec"]["leaderWorkerTemplate"]["workerTemplate"]
 
     # Annotation
     self.assertEqual(
@@ -302,7 +337,7 @@ class TestCreateLwsSpec(absltest.TestCase):
       },
     ]
     spec = self._make_spec(fuse_volume_specs=fuse_specs)
-    pod = spec["spec"]["leaderWorkerTemplate"]["leaderTemplate"]
+    pod = spec["spec"]["leaderWorkerTemplate"]["workerTemplate"]
     volumes = pod["spec"]["volumes"]
     self.assertLen(volumes, 2)
     self.assertEqual(volumes[0]["name"], "gcs-fuse-0")
@@ -323,7 +358,7 @@ class TestCreateLwsSpec(absltest.TestCase):
       }
     ]
     spec = self._make_spec(fuse_volume_specs=fuse_specs)
-    pod = spec["spec"]["leaderWorkerTemplate"]["leaderTemplate"]
+    pod = spec["spec"]["leaderWorkerTemplate"]["workerTemplate"]
     vol = pod["spec"]["volumes"][0]
     self.assertEqual(
       vol["csi"]["volumeAttributes"]["mountOptions"], "implicit-dirs"
@@ -387,9 +422,14 @@ class TestCreateLwsSpecDebug(absltest.TestCase):
     )
     self.assertFalse(any(p.get("name") == "debugpy" for p in worker_ports))
 
+  def test_non_debug_sends_single_pod_template(self):
+    lws = self._make_spec(debug=False)["spec"]["leaderWorkerTemplate"]
+    self.assertNotIn("leaderTemplate", lws)
+    self.assertIn("workerTemplate", lws)
+
   def test_non_debug_has_no_debug_contract(self):
     spec = self._make_spec(debug=False)
-    env = self._env(spec["spec"]["leaderWorkerTemplate"]["leaderTemplate"])
+    env = self._env(spec["spec"]["leaderWorkerTemplate"]["workerTemplate"])
     self.assertNotIn("KINETIC_DEBUG", env)
     self.assertNotIn("KINETIC_DEBUG_WAIT_LEADER", env)
 
@@ -438,6 +478,15 @@ class TestSubmitPathwaysJob(absltest.TestCase):
     body = self._get_created_body()
     self.assertEqual(body["spec"]["leaderWorkerTemplate"]["size"], 1)
 
+  def test_accelerator_parsed_once(self):
+    with mock.patch(
+      f"{_MODULE}.accelerators.parse_accelerator",
+      wraps=accelerators.parse_accelerator,
+    ) as mock_parse:
+      self._call(accelerator="v3-16")
+
+    mock_parse.assert_called_once_with("v3-16", spot=False)
+
   def test_job_name_derived_from_job_id(self):
     self._call(job_id="xyz")
     body = self._get_created_body()
@@ -452,11 +501,14 @@ class TestWaitForJob(absltest.TestCase):
     )
     self.mock_sleep = self.enterContext(mock.patch(f"{_MODULE}.time.sleep"))
     self.mock_time = self.enterContext(
-      mock.patch(f"{_MODULE}.time.time", return_value=0)
+      mock.patch(f"{_MODULE}.time.monotonic", return_value=0)
     )
     self.mock_core = self.enterContext(
       mock.patch("kinetic.backend.k8s_utils.core_v1")
     ).return_value
+    self.mock_wait_change = self.enterContext(
+      mock.patch("kinetic.backend.k8s_utils.wait_for_change", return_value=None)
+    )
 
     self.mock_streamer = MagicMock()
     self.enterContext(
@@ -466,23 +518,25 @@ class TestWaitForJob(absltest.TestCase):
     self.mock_streamer.__exit__ = MagicMock(return_value=False)
 
   def _make_pod(self, phase, container_statuses=None):
-    pod = MagicMock()
-    pod.status.phase = phase
-    pod.status.container_statuses = container_statuses
-    return pod
+    return SimpleNamespace(
+      metadata=SimpleNamespace(
+        name="keras-pathways-j1-0", resource_version="1"
+      ),
+      status=SimpleNamespace(
+        phase=phase, container_statuses=container_statuses
+      ),
+    )
 
   def _make_container_status(
     self, state_terminated=None, last_state_terminated=None
   ):
-    cs = MagicMock()
-    cs.state.terminated = state_terminated
-    cs.last_state.terminated = last_state_terminated
-    return cs
+    return SimpleNamespace(
+      state=SimpleNamespace(terminated=state_terminated),
+      last_state=SimpleNamespace(terminated=last_state_terminated),
+    )
 
   def _make_terminated(self, exit_code):
-    t = MagicMock()
-    t.exit_code = exit_code
-    return t
+    return SimpleNamespace(exit_code=exit_code)
 
   def test_immediate_success_phase(self):
     self.mock_core.read_namespaced_pod.return_value = self._make_pod(
@@ -506,8 +560,8 @@ class TestWaitForJob(absltest.TestCase):
     self.mock_check_pod_scheduling.assert_called_once()
 
   def test_timeout_raises(self):
-    # time.time() is also called by the logging module, so use a callable
-    # that returns increasing values instead of a finite list.
+    # Use a callable that returns increasing values instead of a finite
+    # list, in case anything else reads the clock during the test.
     counter = iter(range(0, 100000, 3601))
     self.mock_time.side_effect = lambda: next(counter)
     self.mock_core.read_namespaced_pod.return_value = self._make_pod(
@@ -522,7 +576,95 @@ class TestWaitForJob(absltest.TestCase):
     self.mock_core.read_namespaced_pod.side_effect = [running, succeeded]
     result = wait_for_job("j1", poll_interval=7)
     self.assertEqual(result, "success")
-    self.mock_sleep.assert_called_with(7)
+    self.mock_wait_change.assert_called_once_with(
+      self.mock_core.list_namespaced_pod, running, "default", 7
+    )
+    self.mock_sleep.assert_not_called()
+
+  def test_uses_pod_from_watch_event_without_rereading(self):
+    running = self._make_pod("Running", container_statuses=None)
+    self.mock_core.read_namespaced_pod.return_value = running
+    self.mock_wait_change.return_value = self._make_pod("Succeeded")
+
+    result = wait_for_job("j1")
+
+    self.assertEqual(result, "success")
+    self.mock_core.read_namespaced_pod.assert_called_once()
+
+  def test_unchanged_pod_is_not_reread(self):
+    running = self._make_pod("Running", container_statuses=None)
+    self.mock_core.read_namespaced_pod.return_value = running
+    self.mock_wait_change.side_effect = [
+      running,
+      running,
+      self._make_pod("Succeeded"),
+    ]
+
+    result = wait_for_job("j1")
+
+    self.assertEqual(result, "success")
+    self.mock_core.read_namespaced_pod.assert_called_once()
+    self.assertEqual(self.mock_wait_change.call_count, 3)
+
+  def test_watch_window_widens_while_pod_unchanged(self):
+    pending = self._make_pod("Pending", container_statuses=None)
+    running = self._make_pod("Running", container_statuses=None)
+    self.mock_core.read_namespaced_pod.return_value = pending
+    self.mock_wait_change.side_effect = [
+      pending,
+      pending,
+      pending,
+      running,
+      self._make_pod("Succeeded"),
+    ]
+
+    with mock.patch("kinetic.backend.k8s_utils.check_pod_scheduling"):
+      wait_for_job("j1", poll_interval=5, max_poll_interval=12)
+
+    intervals = [c[0][3] for c in self.mock_wait_change.call_args_list]
+    self.assertEqual(intervals, [5, 10, 12, 12, 5])
+
+  def test_watch_window_capped_at_time_remaining(self):
+    running = self._make_pod("Running", container_statuses=None)
+    self.mock_core.read_namespaced_pod.return_value = running
+    self.mock_wait_change.return_value = running
+    self.mock_time.side_effect = [0, 0, 25, 30]
+
+    with self.assertRaisesRegex(RuntimeError, "timed out"):
+      wait_for_job("j1", timeout=30, poll_interval=10)
+
+    self.mock_wait_change.assert_called_once_with(
+      self.mock_core.list_namespaced_pod, running, "default", 5
+    )
+
+  def test_deadline_passing_mid_iteration_raises_timeout(self):
+    self.mock_core.read_namespaced_pod.side_effect = ApiException(
+      status=404, reason="Not Found"
+    )
+    self.mock_time.side_effect = [0, 0, 5, 5]
+
+    with self.assertRaisesRegex(RuntimeError, "timed out"):
+      wait_for_job("j1", timeout=3)
+
+    self.mock_sleep.assert_not_called()
+
+  def test_missing_pod_poll_backs_off_to_interval(self):
+    self.enterContext(mock.patch(f"{_MODULE}.random.uniform", return_value=1.0))
+    not_found = ApiException(status=404, reason="Not Found")
+    self.mock_core.read_namespaced_pod.side_effect = [
+      not_found,
+      not_found,
+      not_found,
+      not_found,
+      self._make_pod("Succeeded"),
+    ]
+
+    result = wait_for_job("j1", poll_interval=2)
+
+    self.assertEqual(result, "success")
+    delays = [c[0][0] for c in self.mock_sleep.call_args_list]
+    self.assertEqual(delays, [0.5, 1, 2, 2])
+    self.mock_wait_change.assert_not_called()
 
   def test_pod_404_retries(self):
     succeeded = self._make_pod("Succeeded")
@@ -613,7 +755,12 @@ class TestCleanupJob(absltest.TestCase):
       namespace="default",
       plural=LWS_PLURAL,
       name="my-job",
+      body=mock.ANY,
     )
+    body = self.mock_custom_api.delete_namespaced_custom_object.call_args[1][
+      "body"
+    ]
+    self.assertEqual(body.propagation_policy, "Background")
 
   def test_404_silently_ignored(self):
     self.mock_custom_api.delete_namespaced_custom_object.side_effect = (
@@ -642,16 +789,19 @@ class TestAsyncObservationHelpers(absltest.TestCase):
     ).return_value
 
   def _make_pod(self, phase, exit_code=None):
-    pod = MagicMock()
-    pod.status.phase = phase
-    if exit_code is None:
-      pod.status.container_statuses = None
-    else:
-      container_status = MagicMock()
-      container_status.state.terminated = MagicMock(exit_code=exit_code)
-      container_status.last_state.terminated = None
-      pod.status.container_statuses = [container_status]
-    return pod
+    container_statuses = None
+    if exit_code is not None:
+      container_statuses = [
+        SimpleNamespace(
+          state=SimpleNamespace(
+            terminated=SimpleNamespace(exit_code=exit_code)
+          ),
+          last_state=SimpleNamespace(terminated=None),
+        )
+      ]
+    return SimpleNamespace(
+      status=SimpleNamespace(phase=phase, container_statuses=container_statuses)
+    )
 
   def test_get_job_status_running(self):
     self.mock_core.read_namespaced_pod.return_value = self._make_pod("Running")
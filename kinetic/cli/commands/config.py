@@ -3,6 +3,7 @@
 import os
 
 import click
+from rich.console import Group
 from rich.table import Table
 
 from kinetic.cli.constants import DEFAULT_CLUSTER_NAME, DEFAULT_ZONE
@@ -18,13 +19,23 @@ def config(ctx):
     ctx.invoke(show)
 
 
-def _resolve(env_var, profile_value, default):
+# (label, env var, profile attribute, built-in default) for each setting
+# that follows the env var > profile > default chain.
+_SETTINGS = (
+  ("Project", "KINETIC_PROJECT", "project", None),
+  ("Zone", "KINETIC_ZONE", "zone", DEFAULT_ZONE),
+  ("Cluster Name", "KINETIC_CLUSTER", "cluster", DEFAULT_CLUSTER_NAME),
+  ("Namespace", "KINETIC_NAMESPACE", "namespace", "default"),
+)
+
+
+def _resolve(env, env_var, profile_value, default):
   """Return (value, source) following the CLI precedence chain.
 
   CLI flag is not visible to `config show`, so the effective precedence
   reported here is: env var > active profile > built-in default.
   """
-  env_val = os.environ.get(env_var)
+  env_val = env.get(env_var)
   if env_val:
     return env_val, env_var
   if profile_value is not None:
@@ -54,36 +65,16 @@ def show(ctx):
   table.add_column("Value", style="green")
   table.add_column("Source", style="dim")
 
-  project, src = _resolve(
-    "KINETIC_PROJECT",
-    active.project if active else None,
-    None,
-  )
-  table.add_row("Project", project or "(not set)", src or "")
-
-  zone, src = _resolve(
-    "KINETIC_ZONE",
-    active.zone if active else None,
-    DEFAULT_ZONE,
-  )
-  table.add_row("Zone", zone, src)
-
-  cluster, src = _resolve(
-    "KINETIC_CLUSTER",
-    active.cluster if active else None,
-    DEFAULT_CLUSTER_NAME,
-  )
-  table.add_row("Cluster Name", cluster, src)
-
-  namespace, src = _resolve(
-    "KINETIC_NAMESPACE",
-    active.namespace if active else None,
-    "default",
-  )
-  table.add_row("Namespace", namespace, src)
+  env = os.environ
+  resolved = {}
+  for label, env_var, attr, default in _SETTINGS:
+    value, src = _resolve(
+      env, env_var, getattr(active, attr) if active else None, default
+    )
+    resolved[attr] = value
+    table.add_row(label, value or "(not set)", src or "")
 
-  # Output directory
-  output_dir = os.environ.get("KINETIC_OUTPUT_DIR")
+  output_dir = env.get("KINETIC_OUTPUT_DIR")
   table.add_row(
     "Output Dir",
     output_dir or "(not set)",
@@ -92,14 +83,17 @@ def show(ctx):
 
   # Pulumi state lives in a GCS bucket derived from the project. Not
   # configurable — shown as a fact so users know where to look.
+  project = resolved["project"]
   if project:
     table.add_row("Pulumi State", state_backend_url(project), "auto")
 
-  console.print()
-  console.print(table)
-  console.print()
   console.print(
-    "Precedence: CLI flag > KINETIC_* env var > active profile > default."
+    Group(
+      "",
+      table,
+      "",
+      "Precedence: CLI flag > KINETIC_* env var > active profile > default.",
+      "Manage profiles with 'kinetic profile create|ls|use|show|rm'.",
+      "",
+    )
   )
-  console.print("Manage profiles with 'kinetic profile create|ls|use|show|rm'.")
-  console.print()
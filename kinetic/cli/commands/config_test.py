@@ -7,6 +7,7 @@ from unittest import mock
 from absl.testing import absltest
 from click.testing import CliRunner
 
+from kinetic.cli.commands.config import _resolve
 from kinetic.cli.commands.profile import profile as profile_cmd
 from kinetic.cli.main import cli
 
@@ -65,5 +66,24 @@ class ConfigShowTest(absltest.TestCase):
     self.assertIn("gs://from-env-kinetic-state", result.output)
 
 
+class ResolveTest(absltest.TestCase):
+  def test_env_wins_over_profile(self):
+    env = {"KINETIC_ZONE": "env-zone"}
+    self.assertEqual(
+      _resolve(env, "KINETIC_ZONE", "profile-zone", "default-zone"),
+      ("env-zone", "KINETIC_ZONE"),
+    )
+
+  def test_falls_back_to_profile_then_default(self):
+    self.assertEqual(
+      _resolve({}, "KINETIC_ZONE", "profile-zone", "default-zone"),
+      ("profile-zone", "profile"),
+    )
+    self.assertEqual(
+      _resolve({}, "KINETIC_ZONE", None, "default-zone"),
+      ("default-zone", "default (default-zone)"),
+    )
+
+
 if __name__ == "__main__":
   absltest.main()
@@ -1,10 +1,10 @@
 """kinetic down command — tear down infrastructure."""
 
 import click
+from rich.console import Group
 
 from kinetic.cli.config import InfraConfig
 from kinetic.cli.constants import DEFAULT_CLUSTER_NAME, DEFAULT_ZONE
-from kinetic.cli.infra.state import apply_destroy
 from kinetic.cli.options import common_options
 from kinetic.cli.output import banner, console, warning
 from kinetic.cli.prerequisites_check import check_all
@@ -16,6 +16,8 @@ from kinetic.cli.prompts import resolve_project
 @click.option("--yes", "-y", is_flag=True, help="Skip confirmation prompt")
 def down(project, zone, cluster_name, yes):
   """Tear down kinetic GCP infrastructure."""
+  from kinetic.cli.infra.state import apply_destroy
+
   banner("kinetic Cleanup")
 
   check_all()
@@ -27,13 +29,17 @@ def down(project, zone, cluster_name, yes):
   # Warning
   console.print()
   warning(f"This will delete ALL kinetic resources in project: {project}")
-  console.print()
-  console.print("This includes:")
-  console.print("  - GKE cluster and node pools")
-  console.print("  - Artifact Registry repository and images")
-  console.print("  - Cloud Storage buckets (jobs and builds)")
-  console.print("  - Enabled API services (left enabled)")
-  console.print()
+  console.print(
+    Group(
+      "",
+      "This includes:",
+      "  - GKE cluster and node pools",
+      "  - Artifact Registry repository and images",
+      "  - Cloud Storage buckets (jobs and builds)",
+      "  - Enabled API services (left enabled)",
+      "",
+    )
+  )
 
   if not yes:
     click.confirm("Are you sure you want to continue?", abort=True)
@@ -46,12 +52,13 @@ def down(project, zone, cluster_name, yes):
   # Summary
   console.print()
   banner("Cleanup Complete")
-  console.print()
-  console.print("Check manually for remaining resources:")
-  console.print(
-    f"  GKE: https://console.cloud.google.com/kubernetes/list?project={project}"
-  )
   console.print(
-    f"  Billing: https://console.cloud.google.com/billing?project={project}"
+    Group(
+      "",
+      "Check manually for remaining resources:",
+      "  GKE: https://console.cloud.google.com/kubernetes/list"
+      f"?project={project}",
+      f"  Billing: https://console.cloud.google.com/billing?project={project}",
+      "",
+    )
   )
-  console.print()
@@ -24,7 +24,7 @@ _BASE_PATCHES = {
     return_value="test-project",
   ),
   "apply_destroy": mock.patch(
-    "kinetic.cli.commands.down.apply_destroy", return_value=True
+    "kinetic.cli.infra.state.apply_destroy", return_value=True
   ),
 }
 
@@ -14,8 +14,6 @@ from rich.table import Table
 from kinetic.cli.commands.doctor import run_diagnostics
 from kinetic.cli.commands.up import up
 from kinetic.cli.infra.post_deploy import configure_kubectl
-from kinetic.cli.infra.stack_manager import get_current_zone
-from kinetic.cli.infra.state import list_clusters, load_state
 from kinetic.cli.options import common_options
 from kinetic.cli.output import banner, console, success, warning
 from kinetic.cli.prerequisites_check import (
@@ -133,6 +131,8 @@ def _detect(project_hint):
       report["project_error"] = str(e)
 
   if report["project"]:
+    from kinetic.cli.infra.state import list_clusters
+
     report["local_clusters"] = list_clusters(report["project"])
   return report
 
@@ -311,6 +311,9 @@ def _join_flow(project, clusters, cluster_override):
 
 def _infer_zone(project, cluster_name):
   """Read the cluster's zone from its Pulumi stack outputs. None on failure."""
+  from kinetic.cli.infra.stack_manager import get_current_zone
+  from kinetic.cli.infra.state import load_state
+
   try:
     state = load_state(
       project,
@@ -40,7 +40,7 @@ def _patch_resolve_project(testcase, value="test-proj"):
 
 def _patch_list_clusters(testcase, clusters):
   testcase.enterContext(
-    mock.patch("kinetic.cli.commands.init.list_clusters", return_value=clusters)
+    mock.patch("kinetic.cli.infra.state.list_clusters", return_value=clusters)
   )
 
 
@@ -60,7 +60,7 @@ def _patch_load_state_zone(testcase, zone):
   stack.outputs.return_value = {"zone": mock.MagicMock(value=zone)}
   testcase.enterContext(
     mock.patch(
-      "kinetic.cli.commands.init.load_state",
+      "kinetic.cli.infra.state.load_state",
       return_value=StackState(
         project="test-proj",
         zone=zone,
@@ -331,7 +331,7 @@ class InitJoinZoneInferenceTest(absltest.TestCase):
     stack.outputs.return_value = {}  # 'zone' missing
     self.enterContext(
       mock.patch(
-        "kinetic.cli.commands.init.load_state",
+        "kinetic.cli.infra.state.load_state",
         return_value=StackState(
           project="test-proj",
           zone="placeholder",
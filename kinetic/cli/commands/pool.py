@@ -3,7 +3,6 @@
 import click
 
 from kinetic.cli.config import InfraConfig, NodePoolConfig
-from kinetic.cli.infra.state import apply_preview, apply_update, load_state
 from kinetic.cli.options import common_options
 from kinetic.cli.output import (
   banner,
@@ -59,6 +58,8 @@ def pool_add(
   reservation,
 ):
   """Add an accelerator node pool to the cluster."""
+  from kinetic.cli.infra.state import apply_preview, apply_update, load_state
+
   banner("kinetic Pool Add")
 
   # Parse the accelerator spec first to fail fast on bad input.
@@ -131,6 +132,8 @@ def pool_add(
 )
 def pool_remove(project, zone, cluster_name, pool_name, yes, preview):
   """Remove an accelerator node pool from the cluster."""
+  from kinetic.cli.infra.state import apply_preview, apply_update, load_state
+
   banner("kinetic Pool Remove")
 
   state = load_state(project, zone, cluster_name)
@@ -178,11 +181,21 @@ def pool_remove(project, zone, cluster_name, pool_name, yes, preview):
 
 @pool.command("list")
 @common_options
-def pool_list(project, zone, cluster_name):
+@click.option(
+  "--refresh",
+  is_flag=True,
+  help="Refresh state from GCP before listing instead of using the last"
+  " recorded outputs",
+)
+def pool_list(project, zone, cluster_name, refresh):
   """List accelerator node pools on the cluster."""
+  from kinetic.cli.infra.state import load_state
+
   banner("kinetic Node Pools")
 
-  state = load_state(project, zone, cluster_name, allow_missing=True)
+  state = load_state(
+    project, zone, cluster_name, allow_missing=True, refresh=refresh
+  )
 
   if state.stack is None:
     warning("No Pulumi stack found.")
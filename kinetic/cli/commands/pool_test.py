@@ -63,10 +63,10 @@ class PoolAddTest(absltest.TestCase):
     super().setUp()
     self.runner = CliRunner()
     self.mock_load = self.enterContext(
-      mock.patch("kinetic.cli.commands.pool.load_state")
+      mock.patch("kinetic.cli.infra.state.load_state")
     )
     self.mock_apply = self.enterContext(
-      mock.patch("kinetic.cli.commands.pool.apply_update", return_value=True)
+      mock.patch("kinetic.cli.infra.state.apply_update", return_value=True)
     )
     self.mock_gen = self.enterContext(
       mock.patch(
@@ -137,10 +137,10 @@ class PoolRemoveTest(absltest.TestCase):
     super().setUp()
     self.runner = CliRunner()
     self.mock_load = self.enterContext(
-      mock.patch("kinetic.cli.commands.pool.load_state")
+      mock.patch("kinetic.cli.infra.state.load_state")
     )
     self.mock_apply = self.enterContext(
-      mock.patch("kinetic.cli.commands.pool.apply_update", return_value=True)
+      mock.patch("kinetic.cli.infra.state.apply_update", return_value=True)
     )
 
   def test_remove_existing_pool(self):
@@ -172,7 +172,7 @@ class PoolListTest(absltest.TestCase):
     super().setUp()
     self.runner = CliRunner()
     self.mock_load = self.enterContext(
-      mock.patch("kinetic.cli.commands.pool.load_state")
+      mock.patch("kinetic.cli.infra.state.load_state")
     )
     self.mock_infrastructure_state = self.enterContext(
       mock.patch("kinetic.cli.commands.pool.infrastructure_state")
@@ -190,6 +190,20 @@ class PoolListTest(absltest.TestCase):
     self.assertEqual(result.exit_code, 0, result.output)
     self.mock_infrastructure_state.assert_called_once()
 
+  def test_list_uses_recorded_outputs_by_default(self):
+    self.mock_load.return_value = _make_state(stack=None)
+
+    self.runner.invoke(pool, _LIST_ARGS)
+
+    self.assertFalse(self.mock_load.call_args.kwargs["refresh"])
+
+  def test_list_refresh_flag_refreshes_state(self):
+    self.mock_load.return_value = _make_state(stack=None)
+
+    self.runner.invoke(pool, [*_LIST_ARGS, "--refresh"])
+
+    self.assertTrue(self.mock_load.call_args.kwargs["refresh"])
+
   def test_list_no_outputs_shows_warning(self):
     mock_stack = mock.MagicMock()
     mock_stack.outputs.return_value = {}
@@ -216,12 +230,12 @@ class PoolAddUpdateFailureTest(absltest.TestCase):
     self.runner = CliRunner()
     self.enterContext(
       mock.patch(
-        "kinetic.cli.commands.pool.load_state",
+        "kinetic.cli.infra.state.load_state",
         return_value=_make_state(),
       )
     )
     self.enterContext(
-      mock.patch("kinetic.cli.commands.pool.apply_update", return_value=False)
+      mock.patch("kinetic.cli.infra.state.apply_update", return_value=False)
     )
     self.enterContext(
       mock.patch(
@@ -248,12 +262,12 @@ class PoolRemoveUpdateFailureTest(absltest.TestCase):
     )
     self.enterContext(
       mock.patch(
-        "kinetic.cli.commands.pool.load_state",
+        "kinetic.cli.infra.state.load_state",
         return_value=_make_state(node_pools=[existing]),
       )
     )
     self.enterContext(
-      mock.patch("kinetic.cli.commands.pool.apply_update", return_value=False)
+      mock.patch("kinetic.cli.infra.state.apply_update", return_value=False)
     )
 
   def test_remove_update_failure_warns(self):
@@ -270,7 +284,7 @@ class PoolAddNoStackTest(absltest.TestCase):
     self.runner = CliRunner()
     self.enterContext(
       mock.patch(
-        "kinetic.cli.commands.pool.load_state",
+        "kinetic.cli.infra.state.load_state",
         side_effect=click.ClickException("No Pulumi stack found"),
       )
     )
@@ -295,10 +309,10 @@ class PoolForceDestroyPreservationTest(absltest.TestCase):
     super().setUp()
     self.runner = CliRunner()
     self.mock_load = self.enterContext(
-      mock.patch("kinetic.cli.commands.pool.load_state")
+      mock.patch("kinetic.cli.infra.state.load_state")
     )
     self.mock_apply = self.enterContext(
-      mock.patch("kinetic.cli.commands.pool.apply_update", return_value=True)
+      mock.patch("kinetic.cli.infra.state.apply_update", return_value=True)
     )
     self.enterContext(
       mock.patch(
@@ -338,7 +352,7 @@ class PoolRemoveNoStackTest(absltest.TestCase):
     self.runner = CliRunner()
     self.enterContext(
       mock.patch(
-        "kinetic.cli.commands.pool.load_state",
+        "kinetic.cli.infra.state.load_state",
         side_effect=click.ClickException("No Pulumi stack found"),
       )
     )
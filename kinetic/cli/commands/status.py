@@ -2,7 +2,6 @@
 
 import click
 
-from kinetic.cli.infra.state import load_state
 from kinetic.cli.options import common_options
 from kinetic.cli.output import (
   banner,
@@ -14,11 +13,21 @@ from kinetic.cli.output import (
 
 @click.command()
 @common_options
-def status(project, zone, cluster_name):
+@click.option(
+  "--refresh",
+  is_flag=True,
+  help="Refresh state from GCP before showing it instead of using the last"
+  " recorded outputs",
+)
+def status(project, zone, cluster_name, refresh):
   """Show current kinetic infrastructure state."""
+  from kinetic.cli.infra.state import load_state
+
   banner("kinetic Status")
 
-  state = load_state(project, zone, cluster_name, allow_missing=True)
+  state = load_state(
+    project, zone, cluster_name, allow_missing=True, refresh=refresh
+  )
 
   if state.stack is None:
     warning("No Pulumi stack found.")
@@ -7,7 +7,6 @@ import click
 from kinetic.cli.config import InfraConfig, NodePoolConfig
 from kinetic.cli.constants import DEFAULT_ZONE
 from kinetic.cli.infra.post_deploy import configure_kubectl
-from kinetic.cli.infra.state import apply_preview, apply_update, load_state
 from kinetic.cli.options import common_options, force_destroy_option
 from kinetic.cli.output import (
   banner,
@@ -75,6 +74,8 @@ def up(
   force_destroy,
 ):
   """Provision GCP infrastructure for kinetic."""
+  from kinetic.cli.infra.state import apply_preview, apply_update, load_state
+
   banner("kinetic Setup")
 
   # Check prerequisites
@@ -43,9 +43,9 @@ _CLI_ARGS = [
 # Patches applied to every test to bypass prerequisites and infrastructure.
 _BASE_PATCHES = {
   "check_all": mock.patch("kinetic.cli.commands.up.check_all"),
-  "load_state": mock.patch("kinetic.cli.commands.up.load_state"),
+  "load_state": mock.patch("kinetic.cli.infra.state.load_state"),
   "apply_update": mock.patch(
-    "kinetic.cli.commands.up.apply_update", return_value=True
+    "kinetic.cli.infra.state.apply_update", return_value=True
   ),
   "configure_kubectl": mock.patch(
     "kinetic.cli.commands.up.configure_kubectl",
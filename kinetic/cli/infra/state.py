@@ -51,6 +51,7 @@ def load_state(
   *,
   allow_missing=False,
   check_prerequisites=True,
+  refresh=True,
 ):
   """Load full infrastructure state from the Pulumi stack.
 
@@ -61,6 +62,10 @@ def load_state(
       allow_missing: If True, return empty state when no stack exists
           instead of raising an error. Useful for first-run scenarios.
       check_prerequisites: If True, run prerequisite checks (gcloud, etc.).
+      refresh: If True, refresh the stack against GCP before reading its
+          outputs.  Read-only callers can pass False to use the outputs
+          recorded by the last update, which skips a round trip per
+          resource.
 
   Returns:
       A StackState with all state dimensions populated.
@@ -90,15 +95,16 @@ def load_state(
       "Run 'kinetic up' to provision infrastructure first."
     ) from e
 
-  refresh_failed = False
-  with LiveOutputPanel("Refreshing state", transient=True) as panel:
-    try:
-      stack.refresh(on_output=panel.on_output)
-    except auto.errors.CommandError:
-      panel.mark_error()
-      refresh_failed = True
-  if refresh_failed:
-    warning("State refresh encountered an issue (using cached state).")
+  if refresh:
+    refresh_failed = False
+    with LiveOutputPanel("Refreshing state", transient=True) as panel:
+      try:
+        stack.refresh(on_output=panel.on_output)
+      except auto.errors.CommandError:
+        panel.mark_error()
+        refresh_failed = True
+    if refresh_failed:
+      warning("State refresh encountered an issue (using cached state).")
 
   node_pools = get_current_node_pools(stack)
   force_destroy = get_current_force_destroy(stack)
@@ -90,6 +90,18 @@ class LoadStateTest(absltest.TestCase):
     self.assertIsNotNone(result.stack)
     self.mock_get_pools.assert_called_once()
 
+  def test_refreshes_by_default(self):
+    state.load_state("proj", "us-central1-a", "cluster")
+
+    self.mock_stack.refresh.assert_called_once()
+
+  def test_skips_refresh_when_disabled(self):
+    result = state.load_state("proj", "us-central1-a", "cluster", refresh=False)
+
+    self.mock_stack.refresh.assert_not_called()
+    self.assertIsNotNone(result.stack)
+    self.mock_get_pools.assert_called_once_with(self.mock_stack)
+
   def test_loads_force_destroy_from_stack(self):
     self.mock_get_force_destroy.return_value = False
 
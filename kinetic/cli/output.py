@@ -107,6 +107,8 @@ class LiveOutputPanel:
     self._live = None
     self._start_time = None
     self._phrase_order = None
+    self._content_key = None
+    self._content = None
 
   def __enter__(self):
     self._start_time = time.monotonic()
@@ -139,12 +141,17 @@ class LiveOutputPanel:
     return self._make_panel()
 
   def on_output(self, line):
-    """Append a line and refresh the display."""
+    """Append a line; the Live refresh timer redraws the panel.
+
+    Lines are shown verbatim: tool output such as Pulumi's
+    ``[diff: ~nodeConfig]`` would otherwise be parsed as Rich markup and
+    dropped.
+    """
     stripped = line.rstrip("\n")
     if self._live:
       self._lines.append(stripped)
     else:
-      self._console.print(stripped)
+      self._console.out(stripped, highlight=False)
 
   def mark_error(self):
     """Turn the panel border yellow to indicate an error."""
@@ -163,14 +170,25 @@ class LiveOutputPanel:
     suffix = "" if message.startswith("Tip:") else "..."
     return f"[italic]{spinner} {message}{suffix}[/italic]"
 
+  def _make_content(self):
+    # Live calls this on every refresh tick, while lines only change when
+    # output arrives; reuse the text until the line count or the error
+    # state (which switches to the full history) changes.  Wrapping it in
+    # Text keeps Rich from re-parsing the lines as markup on every tick.
+    key = (len(self._lines), self._has_error)
+    if key != self._content_key:
+      if self._lines:
+        visible = (
+          self._lines if self._has_error else self._lines[-self._max_lines :]
+        )
+        self._content = Text("\n".join(visible))
+      else:
+        self._content = Text("Waiting...")
+      self._content_key = key
+    return self._content
+
   def _make_panel(self):
-    if self._lines:
-      visible = (
-        self._lines if self._has_error else self._lines[-self._max_lines :]
-      )
-      content = "\n".join(visible)
-    else:
-      content = "Waiting..."
+    content = self._make_content()
     style = "yellow" if self._has_error else "blue"
     return Panel(
       content,
@@ -1,5 +1,6 @@
 """Tests for kinetic.cli.output — LiveOutputPanel."""
 
+import io
 from unittest import mock
 
 from absl.testing import absltest
@@ -39,6 +40,30 @@ class MakePanelTest(absltest.TestCase):
     self.assertIn("line 0", content)
     self.assertIn("line 9", content)
 
+  def test_content_reused_until_lines_change(self):
+    panel = LiveOutputPanel("Title", max_lines=3)
+    panel._lines.extend(["a", "b"])
+
+    first = panel._make_panel().renderable
+    self.assertIs(panel._make_panel().renderable, first)
+
+    panel._lines.append("c")
+    self.assertEqual(panel._make_panel().renderable.plain, "a\nb\nc")
+
+    panel._lines.append("d")
+    self.assertEqual(panel._make_panel().renderable.plain, "b\nc\nd")
+
+    panel._has_error = True
+    self.assertEqual(panel._make_panel().renderable.plain, "a\nb\nc\nd")
+
+  def test_lines_are_not_parsed_as_markup(self):
+    panel = LiveOutputPanel("Title")
+    panel._lines.append("~ pool updating [diff: ~nodeConfig]")
+
+    content = panel._make_panel().renderable
+
+    self.assertEqual(content.plain, "~ pool updating [diff: ~nodeConfig]")
+
   def test_subtitle_suppressed_on_error(self):
     panel = LiveOutputPanel("Title")
     panel._has_error = True
@@ -104,5 +129,16 @@ class TransientBehaviorTest(absltest.TestCase):
     self.assertTrue(panel._has_error)
 
 
+class NonTerminalOutputTest(absltest.TestCase):
+  def test_lines_printed_verbatim(self):
+    buf = io.StringIO()
+    console = Console(force_terminal=False, file=buf)
+
+    with LiveOutputPanel("Test", target_console=console) as panel:
+      panel.on_output("~ pool updating [diff: ~nodeConfig]\n")
+
+    self.assertIn("~ pool updating [diff: ~nodeConfig]\n", buf.getvalue())
+
+
 if __name__ == "__main__":
   absltest.main()
@@ -141,6 +141,24 @@ class TestBatchHandle(absltest.TestCase):
     ):
       handle.wait()
 
+  def test_wait_stops_polling_terminal_jobs(self):
+    handle = _make_batch_handle(2)
+    done, running = handle.jobs
+    with (
+      mock.patch.object(
+        done, "status", return_value=JobStatus.SUCCEEDED
+      ) as done_status,
+      mock.patch.object(
+        running,
+        "status",
+        side_effect=[JobStatus.RUNNING, JobStatus.RUNNING, JobStatus.FAILED],
+      ),
+      mock.patch("kinetic.collections.time.sleep"),
+    ):
+      handle.wait()
+
+    done_status.assert_called_once()
+
   def test_wait_timeout(self):
     handle = _make_batch_handle(1)
     with (
@@ -278,6 +296,20 @@ class TestBatchHandle(absltest.TestCase):
     mock_cleanup.assert_called_with(k8s=True, gcs=False)
     mock_manifest.assert_not_called()
 
+  def test_cleanup_continues_past_failed_job(self):
+    handle = _make_batch_handle(3)
+    with (
+      mock.patch.object(
+        JobHandle,
+        "cleanup",
+        side_effect=[RuntimeError("boom"), None, None],
+      ) as mock_cleanup,
+      mock.patch("kinetic.collections.storage.cleanup_manifest"),
+    ):
+      handle.cleanup(k8s=True, gcs=False)
+
+    self.assertEqual(mock_cleanup.call_count, 3)
+
   def test_results_unordered_returns_completion_order(self):
     """ordered=False should yield results in completion order."""
     handle = _make_batch_handle(2)
@@ -7,6 +7,11 @@ DEFAULT_ZONE = "us-central1-a"
 DEFAULT_CLUSTER_NAME = "kinetic-cluster"
 DEFAULT_REGION = DEFAULT_ZONE.rsplit("-", 1)[0]  # "us-central1"
 
+# Filesystem timestamps are coarse, so a file modified within this window
+# may be rewritten again without changing its stat fields.  Caches keyed on
+# those fields skip such files.
+RACY_MTIME_NS = 2_000_000_000
+
 
 def get_default_zone():
   """Return zone from KINETIC_ZONE env var, or DEFAULT_ZONE."""
@@ -4,13 +4,16 @@ Single source of truth for all accelerator metadata — used by both the
 runtime (gke_client, container_builder) and the CLI (up, prompts, program).
 """
 
+import functools
 import re
+import types
 import uuid
-from dataclasses import dataclass
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 from typing import Union
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GpuConfig:
   """Fully resolved GPU accelerator configuration."""
 
@@ -21,7 +24,7 @@ class GpuConfig:
   spot: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TpuConfig:
   """Fully resolved TPU accelerator configuration."""
 
@@ -37,7 +40,7 @@ class TpuConfig:
 Accelerator = Union[GpuConfig, TpuConfig, None]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GpuSpec:
   """Registry entry for a GPU type."""
 
@@ -45,7 +48,7 @@ class GpuSpec:
   counts: dict[int, str]  # count -> machine_type
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TpuTopologySpec:
   """Single topology option for a TPU type."""
 
@@ -54,13 +57,24 @@ class TpuTopologySpec:
   num_nodes: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TpuSpec:
   """Registry entry for a TPU type."""
 
   gke_accelerator: str
   default_chips: int
   topologies: dict[int, TpuTopologySpec]  # chips → topology spec
+  # topology string → chips; derived from `topologies`.
+  chips_by_topology: dict[str, int] = field(
+    init=False, repr=False, compare=False
+  )
+
+  def __post_init__(self):
+    object.__setattr__(
+      self,
+      "chips_by_topology",
+      {ts.topology: chips for chips, ts in self.topologies.items()},
+    )
 
 
 GPUS: dict[str, GpuSpec] = {
@@ -137,9 +151,9 @@ GPUS: dict[str, GpuSpec] = {
   ),
 }
 
-_GPU_ALIASES: dict[str, str] = {
-  spec.gke_label: name for name, spec in GPUS.items()
-}
+_GPU_ALIASES: Mapping[str, str] = types.MappingProxyType(
+  {spec.gke_label: name for name, spec in GPUS.items()}
+)
 
 # Topology reference — verify new entries against:
 #   https://docs.cloud.google.com/kubernetes-engine/docs/concepts/plan-tpus
@@ -216,9 +230,16 @@ TPU_ALIASES: dict[str, str] = {
   "v5e": "v5litepod",
 }
 
+# GKE machine type → TPU chips per node, e.g. "ct5p-hightpu-4t" → 4.
+TPU_CHIPS_PER_NODE: Mapping[str, int] = types.MappingProxyType(
+  {
+    ts.machine_type: chips // ts.num_nodes
+    for spec in TPUS.values()
+    for chips, ts in spec.topologies.items()
+  }
+)
+
 
-_MULTI_GPU_RE = re.compile(r"^([^x]+)(?:x)(\d+)$")  # "a100x4"
-_TPU_CHIPS_RE = re.compile(r"^([a-z0-9_]+)-(\d+)$")  # "v3-8"
 _TPU_TOPO_RE = re.compile(
   r"^([a-z0-9_]+)-(\d+x\d+(?:x\d+)?)$"
 )  # "v5litepod-2x2"
@@ -239,6 +260,42 @@ PREFERRED_GPUS = [
 PREFERRED_TPUS = ["v6e", "v5p", "v5litepod", "v4", "v3"]
 
 
+# The registry is static, so every valid non-generic accelerator string can
+# be enumerated up front.  parse_accelerator serves these with a single dict
+# lookup and only falls through to the slower parser for malformed input or
+# unsupported counts (which need the detailed error messages).  The tables
+# are built on first parse, so importing this module for the registry alone
+# (e.g. the CLI) does not pay for them, and are returned as read-only views:
+# parse_accelerator results are memoized, so the derived lookups must not
+# drift from the registry at runtime.
+@functools.cache
+def _gpu_forms() -> Mapping[str, tuple[str, int]]:
+  """Map every well-formed GPU name/count string to ``(name, count)``."""
+  forms: dict[str, tuple[str, int]] = {}
+  for name, spec in GPUS.items():
+    for alias in (name, spec.gke_label):
+      forms[alias] = (name, 1)
+      for count in spec.counts:
+        forms[f"{alias}x{count}"] = (name, count)
+  return types.MappingProxyType(forms)
+
+
+@functools.cache
+def _tpu_forms() -> Mapping[str, tuple[str, int]]:
+  """Map every well-formed TPU name/chips/topology string to ``(name, chips)``."""
+  forms: dict[str, tuple[str, int]] = {}
+  for name, spec in TPUS.items():
+    aliases = [name] + [
+      a for a, target in TPU_ALIASES.items() if target == name
+    ]
+    for alias in aliases:
+      forms[alias] = (name, spec.default_chips)
+      for chips, topo_spec in spec.topologies.items():
+        forms[f"{alias}-{chips}"] = (name, chips)
+        forms[f"{alias}-{topo_spec.topology}"] = (name, chips)
+  return types.MappingProxyType(forms)
+
+
 def _resolve_gpu_alias(name: str) -> str:
   return _GPU_ALIASES.get(name, name)
 
@@ -247,10 +304,13 @@ def _resolve_tpu_alias(name: str) -> str:
   return TPU_ALIASES.get(name, name)
 
 
+@functools.lru_cache(maxsize=256)
 def parse_accelerator(accel_str: str, spot: bool = False) -> Accelerator:
   """Parse an accelerator string into a fully resolved config.
 
-  Returns GpuConfig, TpuConfig, or None (for "cpu").
+  Returns GpuConfig, TpuConfig, or None (for "cpu").  Results are memoized
+  per ``(accel_str, spot)``; the returned configs are frozen, so sharing
+  cached instances between callers is safe.
 
   Accepted formats:
       - Generic: "gpu", "tpu", "cpu" (resolves to defaults)
@@ -291,6 +351,16 @@ def parse_accelerator(accel_str: str, spot: bool = False) -> Accelerator:
   if s == "tpu":
     return make_tpu(DEFAULT_TPU, TPUS[DEFAULT_TPU].default_chips, spot=spot)
 
+  # 0) Fast path for precomputed well-formed strings.
+  if not s.startswith("tpu:"):
+    hit = _gpu_forms().get(s.removeprefix("gpu:"))
+    if hit is not None:
+      return make_gpu(*hit, spot=spot)
+  if not s.startswith("gpu:"):
+    hit = _tpu_forms().get(s.removeprefix("tpu:"))
+    if hit is not None:
+      return make_tpu(*hit, spot=spot)
+
   # 1) Try parsing as GPU
   is_gpu_explicit = s.startswith("gpu:")
   gpu_str = s[4:] if is_gpu_explicit else s
@@ -312,11 +382,13 @@ def parse_accelerator(accel_str: str, spot: bool = False) -> Accelerator:
   if name in GPUS:
     return make_gpu(name, 1, spot=spot)
 
-  m = _MULTI_GPU_RE.match(gpu_str)
-  if m:
-    name = _resolve_gpu_alias(m.group(1))
+  # "a100x4": a plain split on the last "x" is enough here, since no GPU
+  # name or alias contains an "x".
+  head, sep, tail = gpu_str.rpartition("x")
+  if sep and tail.isdecimal():
+    name = _resolve_gpu_alias(head)
     if name in GPUS:
-      return make_gpu(name, int(m.group(2)), spot=spot)
+      return make_gpu(name, int(tail), spot=spot)
 
   if is_gpu_explicit:
     raise ValueError(f"Unknown GPU accelerator: '{accel_str}'")
@@ -347,20 +419,21 @@ def parse_accelerator(accel_str: str, spot: bool = False) -> Accelerator:
     name = _resolve_tpu_alias(m.group(1))
     if name in TPUS:
       topo_str = m.group(2)
-      for chips, topo_spec in TPUS[name].topologies.items():
-        if topo_spec.topology == topo_str:
-          return make_tpu(name, chips, spot=spot)
+      chips = TPUS[name].chips_by_topology.get(topo_str)
+      if chips is not None:
+        return make_tpu(name, chips, spot=spot)
       valid = [ts.topology for ts in TPUS[name].topologies.values()]
       raise ValueError(
         f"Topology '{topo_str}' not supported for '{name}'. "
         f"Supported: {', '.join(valid)}."
       )
 
-  m = _TPU_CHIPS_RE.match(tpu_str)
-  if m:
-    name = _resolve_tpu_alias(m.group(1))
+  # "v3-8"
+  head, sep, tail = tpu_str.rpartition("-")
+  if sep and tail.isdecimal():
+    name = _resolve_tpu_alias(head)
     if name in TPUS:
-      return make_tpu(name, int(m.group(2)), spot=spot)
+      return make_tpu(name, int(tail), spot=spot)
 
   raise ValueError(
     f"Unknown accelerator: '{accel_str}'. "
@@ -1,10 +1,13 @@
 """Tests for kinetic.core.accelerators — parser, registry, categories."""
 
+import pickle
+
 from absl.testing import absltest, parameterized
 
 from kinetic.core.accelerators import (
   _GPU_ALIASES,
   GPUS,
+  TPU_CHIPS_PER_NODE,
   TPUS,
   GpuConfig,
   TpuConfig,
@@ -298,6 +301,31 @@ class TestParseNormalizationAndErrors(absltest.TestCase):
     with self.assertRaisesRegex(ValueError, "Unknown accelerator"):
       parse_accelerator("unknown")
 
+  def test_non_ascii_digit_suffix_is_unknown(self):
+    for accel in ("a100x\u00b2", "v3-\u00b2"):
+      with self.assertRaisesRegex(ValueError, "Unknown accelerator"):
+        parse_accelerator(accel)
+
+  def test_repeated_parse_returns_cached_config(self):
+    self.assertIs(
+      parse_accelerator("v5litepod-4"), parse_accelerator("v5litepod-4")
+    )
+    self.assertIsNot(
+      parse_accelerator("v5litepod-4"),
+      parse_accelerator("v5litepod-4", spot=True),
+    )
+
+  def test_configs_are_slotted_and_picklable(self):
+    for accel in ("a100x4", "v5p-8:spot"):
+      config = parse_accelerator(accel)
+      self.assertFalse(hasattr(config, "__dict__"))
+      self.assertEqual(pickle.loads(pickle.dumps(config)), config)
+
+  def test_errors_are_raised_on_every_call(self):
+    for _ in range(2):
+      with self.assertRaisesRegex(ValueError, "Unknown accelerator"):
+        parse_accelerator("unknown")
+
 
 class TestParseDashPrefix(absltest.TestCase):
   """Dash-prefixed forms (gpu-l4, tpu-v3-8) are equivalent to colon forms."""
@@ -407,6 +435,32 @@ class TestGeneratePoolName(absltest.TestCase):
 
 
 class TestRegistryIntegrity(absltest.TestCase):
+  def test_chips_by_topology_inverts_topologies(self):
+    for name, spec in TPUS.items():
+      for chips, topo_spec in spec.topologies.items():
+        self.assertEqual(
+          spec.chips_by_topology[topo_spec.topology], chips, name
+        )
+      self.assertLen(spec.chips_by_topology, len(spec.topologies))
+
+  def test_tpu_specs_pickle_round_trip(self):
+    for name, spec in TPUS.items():
+      restored = pickle.loads(pickle.dumps(spec))
+      self.assertEqual(restored, spec, name)
+      self.assertEqual(restored.chips_by_topology, spec.chips_by_topology, name)
+
+  def test_chips_per_node_matches_machine_type_suffix(self):
+    # Machine-type suffix "-Nt" encodes the chips per VM.
+    for machine_type, chips in TPU_CHIPS_PER_NODE.items():
+      self.assertEqual(
+        machine_type.rsplit("-", 1)[1], f"{chips}t", machine_type
+      )
+
+  def test_derived_lookup_tables_are_read_only(self):
+    with self.assertRaises(TypeError):
+      _GPU_ALIASES["nvidia-fake"] = "l4"
+    self.assertNotIn("nvidia-fake", _GPU_ALIASES)
+
   def test_all_gpus_have_nonempty_counts(self):
     for name, spec in GPUS.items():
       self.assertNotEmpty(spec.counts, f"GPU '{name}' has empty counts")
@@ -433,6 +487,19 @@ class TestRegistryIntegrity(absltest.TestCase):
       )
       self.assertEqual(_GPU_ALIASES[spec.gke_label], name)
 
+  def test_every_registry_entry_parses(self):
+    for name, spec in GPUS.items():
+      for count, machine_type in spec.counts.items():
+        result = parse_accelerator(f"gpu:{spec.gke_label}x{count}")
+        self.assertEqual((result.name, result.count), (name, count))
+        self.assertEqual(result.machine_type, machine_type)
+    for name, spec in TPUS.items():
+      for chips, topo_spec in spec.topologies.items():
+        by_chips = parse_accelerator(f"tpu:{name}-{chips}")
+        by_topology = parse_accelerator(f"{name}-{topo_spec.topology}")
+        self.assertEqual(by_chips, by_topology)
+        self.assertEqual((by_chips.name, by_chips.chips), (name, chips))
+
 
 if __name__ == "__main__":
   absltest.main()
@@ -175,16 +175,19 @@ def _adc_interactive_login() -> None:
 def ensure_kubeconfig(project: str, zone: str, cluster: str) -> None:
   """Ensure kubeconfig is configured for the target GKE cluster.
 
-  Loads the existing kubeconfig and verifies the active context points to the
-  expected cluster (``gke_{project}_{zone}_{cluster}``).  If the context is
-  wrong or kubeconfig is missing, runs ``gcloud container clusters
+  Reads the existing kubeconfig and verifies the active context points to
+  the expected cluster (``gke_{project}_{zone}_{cluster}``).  If the context
+  is wrong or kubeconfig is missing, runs ``gcloud container clusters
   get-credentials`` to configure it.
+
+  Only the context list is read here.  Loading the client configuration
+  (which runs the auth plugin) is left to ``k8s_utils.load_kube_config``,
+  which does it once per process.
   """
   expected = f"gke_{project}_{zone}_{cluster}"
 
-  # Try loading existing kubeconfig and validate the active context.
+  # Read the existing kubeconfig and validate the active context.
   try:
-    config.load_kube_config()
     contexts, active_context = config.list_kube_config_contexts()
 
     if active_context:
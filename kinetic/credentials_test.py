@@ -169,7 +169,6 @@ class TestEnsureKubeconfig(absltest.TestCase):
   def test_correct_cluster_context(self):
     """When the active context matches the expected cluster, no reconfigure."""
     with (
-      mock.patch(f"{_MODULE}.config.load_kube_config"),
       mock.patch(
         f"{_MODULE}.config.list_kube_config_contexts",
         return_value=self._mock_active_context(
@@ -181,10 +180,24 @@ class TestEnsureKubeconfig(absltest.TestCase):
       credentials.ensure_kubeconfig("my-proj", "us-central1-a", "my-cluster")
       mock_configure.assert_not_called()
 
+  def test_does_not_load_client_config(self):
+    """Only the context list is read; the auth plugin is not run here."""
+    with (
+      mock.patch(f"{_MODULE}.config.load_kube_config") as mock_load,
+      mock.patch(
+        f"{_MODULE}.config.list_kube_config_contexts",
+        return_value=self._mock_active_context(
+          "gke_my-proj_us-central1-a_my-cluster"
+        ),
+      ),
+      mock.patch(f"{_MODULE}._configure_kubeconfig"),
+    ):
+      credentials.ensure_kubeconfig("my-proj", "us-central1-a", "my-cluster")
+    mock_load.assert_not_called()
+
   def test_wrong_cluster_context_triggers_reconfigure(self):
     """When the active context doesn't match, reconfigure."""
     with (
-      mock.patch(f"{_MODULE}.config.load_kube_config"),
       mock.patch(
         f"{_MODULE}.config.list_kube_config_contexts",
         return_value=self._mock_active_context(
@@ -202,7 +215,7 @@ class TestEnsureKubeconfig(absltest.TestCase):
     """When no kubeconfig exists, configure from scratch."""
     with (
       mock.patch(
-        f"{_MODULE}.config.load_kube_config",
+        f"{_MODULE}.config.list_kube_config_contexts",
         side_effect=ConfigException("no config"),
       ),
       mock.patch(f"{_MODULE}._configure_kubeconfig") as mock_configure,
@@ -215,7 +228,7 @@ class TestEnsureKubeconfig(absltest.TestCase):
   def test_configure_failure_raises(self):
     with (
       mock.patch(
-        f"{_MODULE}.config.load_kube_config",
+        f"{_MODULE}.config.list_kube_config_contexts",
         side_effect=ConfigException("no config"),
       ),
       mock.patch(
@@ -8,20 +8,39 @@ import hashlib
 import itertools
 import os
 import posixpath
+import time
 from collections import deque
 from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 
 from absl import logging
 
+from kinetic.constants import RACY_MTIME_NS
+
 # Directories with more files than this threshold are hashed in parallel
 # using a thread pool. Below this, sequential hashing avoids pool overhead.
 _PARALLEL_HASH_THRESHOLD = 16
 _HASH_BATCH_SIZE = 512
 
+# Per-file digests keyed by (fpath, relpath) and validated against the
+# file's (st_ino, st_ctime_ns, st_mtime_ns, st_size), so repeated
+# content_hash() calls in one process (e.g. the same Data passed to many
+# submissions) only re-read files that changed.  The inode and ctime catch
+# same-size replacements that preserve mtime (cp -p, rsync -a, tar x).
+# Bounded to keep huge datasets from pinning memory.
+_DIGEST_CACHE_MAX_ENTRIES = 100_000
+_digest_cache: dict[tuple[str, str], tuple[tuple[int, ...], bytes]] = {}
+
 
 def _hash_single_file(fpath: str, relpath: str) -> bytes:
   """SHA-256 of relpath + \\0 + file contents. Returns raw 32-byte digest."""
+  st = os.stat(fpath)
+  cache_key = (fpath, relpath)
+  stat_key = (st.st_ino, st.st_ctime_ns, st.st_mtime_ns, st.st_size)
+  cached = _digest_cache.get(cache_key)
+  if cached is not None and cached[0] == stat_key:
+    return cached[1]
+
   h = hashlib.sha256()
   h.update(relpath.encode("utf-8"))
   h.update(b"\0")
@@ -29,7 +48,12 @@ def _hash_single_file(fpath: str, relpath: str) -> bytes:
   with open(fpath, "rb") as f:
     for chunk in iter(partial(f.read, 2**18), b""):
       h.update(chunk)
-  return h.digest()
+  digest = h.digest()
+  if st.st_mtime_ns < time.time_ns() - RACY_MTIME_NS and (
+    cache_key in _digest_cache or len(_digest_cache) < _DIGEST_CACHE_MAX_ENTRIES
+  ):
+    _digest_cache[cache_key] = (stat_key, digest)
+  return digest
 
 
 def _hash_file_batch(batch: list[tuple[str, str]]) -> list[bytes]:
@@ -8,7 +8,11 @@ from unittest import mock
 from absl.testing import absltest
 
 from kinetic.data import Data, is_data_ref, make_data_ref
-from kinetic.data.data import _PARALLEL_HASH_THRESHOLD, parse_gcs_uri
+from kinetic.data.data import (
+  _PARALLEL_HASH_THRESHOLD,
+  _digest_cache,
+  parse_gcs_uri,
+)
 
 
 def _make_temp_path(test_case):
@@ -160,6 +164,54 @@ class TestContentHash(absltest.TestCase):
 
     self.assertNotEqual(h1, h2)
 
+  def test_unchanged_files_are_not_reread(self):
+    tmp = _make_temp_path(self)
+    d = tmp / "dataset"
+    d.mkdir()
+    (d / "train.csv").write_text("train data")
+    os.utime(d / "train.csv", ns=(0, 0))
+
+    h1 = Data(str(d)).content_hash()
+    with mock.patch("builtins.open", wraps=open) as mock_open:
+      h2 = Data(str(d)).content_hash()
+
+    self.assertEqual(h1, h2)
+    mock_open.assert_not_called()
+
+  def test_cached_digest_invalidated_by_mtime_change(self):
+    tmp = _make_temp_path(self)
+    f = tmp / "data.csv"
+    f.write_text("original")
+    os.utime(f, ns=(0, 0))
+    h1 = Data(str(f)).content_hash()
+
+    f.write_text("modified")
+    os.utime(f, ns=(10**9, 10**9))
+    h2 = Data(str(f)).content_hash()
+
+    self.assertNotEqual(h1, h2)
+
+  def test_cached_digest_invalidated_by_same_size_rewrite(self):
+    tmp = _make_temp_path(self)
+    f = tmp / "data.csv"
+    f.write_text("original")
+    os.utime(f, ns=(0, 0))
+    h1 = Data(str(f)).content_hash()
+
+    f.write_text("modifier")
+    os.utime(f, ns=(0, 0))
+    h2 = Data(str(f)).content_hash()
+
+    self.assertNotEqual(h1, h2)
+
+  def test_recently_modified_files_are_not_cached(self):
+    tmp = _make_temp_path(self)
+    f = tmp / "data.csv"
+    f.write_text("original")
+    Data(str(f)).content_hash()
+
+    self.assertNotIn((str(f), "data.csv"), _digest_cache)
+
   def test_file_vs_dir_different_hash(self):
     """A single file and a directory containing only that file should
     produce different hashes due to the type prefix."""
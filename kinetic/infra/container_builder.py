@@ -3,7 +3,6 @@
 import hashlib
 import os
 import re
-import shutil
 import string
 import sys
 import tarfile
@@ -333,8 +332,11 @@ def _build_and_push(
 
     source_object = source_gcs.removeprefix(f"gs://{bucket_name}/")
     build_sa = _build_service_account(project, cluster_name)
+    # A moving per-category tag seeds the layer cache for the next build
+    # whose requirements hash differs.
+    cache_ref = f"{image_uri.rsplit(':', 1)[0]}:{category}-buildcache"
     build_config = _ar_build_config(
-      image_uri, bucket_name, source_object, build_sa
+      image_uri, bucket_name, source_object, build_sa, cache_ref=cache_ref
     )
 
     _submit_and_wait_build(build_config, project, image_uri)
@@ -351,6 +353,11 @@ def _generate_dockerfile(
 ) -> str:
   """Generate Dockerfile content based on configuration.
 
+  The template orders layers from least to most frequently changing
+  (system packages, uv, requirements, runner) so a rebuild only re-runs
+  the steps after the first changed input.  User source is not baked in;
+  the runner downloads it at start-up.
+
   Args:
       base_image: Base Docker image
       has_requirements: Whether filtered requirements content is available
@@ -490,24 +497,24 @@ def prepare_requirements_content(
 def _prepare_dockerfile(
   tmpdir: str, category: str, dockerfile: str | None
 ) -> str:
-  """Write the Dockerfile into *tmpdir* and return its path.
+  """Return the path of the Dockerfile to pack into the build context.
 
-  Uses a caller-supplied file when *dockerfile* is set, otherwise
-  auto-generates one with core deps for the given accelerator
-  *category*.
+  Uses a caller-supplied file as-is when *dockerfile* is set (it is
+  added to the tarball under the name `Dockerfile`, so there is no need
+  to stage a copy), otherwise auto-generates one in *tmpdir* with core
+  deps for the given accelerator *category*.
   """
-  dst = os.path.join(tmpdir, "Dockerfile")
   if dockerfile:
-    shutil.copy(dockerfile, dst)
-  else:
-    py_version = f"{sys.version_info.major}.{sys.version_info.minor}"
-    content = _generate_dockerfile(
-      base_image=f"python:{py_version}-slim",
-      has_requirements=False,
-      category=category,
-    )
-    with open(dst, "w") as f:
-      f.write(content)
+    return dockerfile
+  dst = os.path.join(tmpdir, "Dockerfile")
+  py_version = f"{sys.version_info.major}.{sys.version_info.minor}"
+  content = _generate_dockerfile(
+    base_image=f"python:{py_version}-slim",
+    has_requirements=False,
+    category=category,
+  )
+  with open(dst, "w") as f:
+    f.write(content)
   return dst
 
 
@@ -522,13 +529,11 @@ def _pack_build_context(
   files can be included via *extra_files* mapping `{arcname: local_path}`.
   """
   remote_runner_src = os.path.join(_RUNNER_DIR, REMOTE_RUNNER_FILE_NAME)
-  remote_runner_dst = os.path.join(tmpdir, REMOTE_RUNNER_FILE_NAME)
-  shutil.copy(remote_runner_src, remote_runner_dst)
 
   tarball_path = os.path.join(tmpdir, "source.tar.gz")
   with tarfile.open(tarball_path, "w:gz") as tar:
     tar.add(dockerfile_path, arcname="Dockerfile")
-    tar.add(remote_runner_dst, arcname=REMOTE_RUNNER_FILE_NAME)
+    tar.add(remote_runner_src, arcname=REMOTE_RUNNER_FILE_NAME)
     for arcname, local_path in (extra_files or {}).items():
       tar.add(local_path, arcname=arcname)
   return tarball_path
@@ -637,20 +642,45 @@ def _ar_build_config(
   bucket_name: str,
   source_object: str,
   service_account: str,
+  cache_ref: str | None = None,
 ) -> cloudbuild_v1.Build:
-  """Return a Cloud Build config that builds and pushes to Artifact Registry."""
+  """Return a Cloud Build config that builds and pushes to Artifact Registry.
+
+  When *cache_ref* is set, the build imports BuildKit layer cache from that
+  image and pushes the result back to it with inline cache metadata, so a
+  rebuild only re-runs the steps whose inputs changed.
+  """
+  if cache_ref is None:
+    build_step = cloudbuild_v1.BuildStep(
+      name=_CLOUD_BUILDER_DOCKER,
+      args=["build", "-t", image_tag, "."],
+    )
+    images = [image_tag]
+  else:
+    build_step = cloudbuild_v1.BuildStep(
+      name=_CLOUD_BUILDER_DOCKER,
+      env=["DOCKER_BUILDKIT=1"],
+      args=[
+        "build",
+        "--build-arg",
+        "BUILDKIT_INLINE_CACHE=1",
+        "--cache-from",
+        cache_ref,
+        "-t",
+        image_tag,
+        "-t",
+        cache_ref,
+        ".",
+      ],
+    )
+    images = [image_tag, cache_ref]
   return cloudbuild_v1.Build(
     service_account=service_account,
     options=cloudbuild_v1.BuildOptions(
       logging=cloudbuild_v1.BuildOptions.LoggingMode.CLOUD_LOGGING_ONLY,
     ),
-    steps=[
-      cloudbuild_v1.BuildStep(
-        name=_CLOUD_BUILDER_DOCKER,
-        args=["build", "-t", image_tag, "."],
-      ),
-    ],
-    images=[image_tag],
+    steps=[build_step],
+    images=images,
     source=cloudbuild_v1.Source(
       storage_source=cloudbuild_v1.StorageSource(
         bucket=bucket_name,
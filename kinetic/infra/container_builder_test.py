@@ -1,6 +1,7 @@
 """Tests for kinetic.infra.container_builder — hashing, Dockerfile gen, caching."""
 
 import os
+import tarfile
 import tempfile
 from unittest import mock
 from unittest.mock import MagicMock
@@ -9,11 +10,14 @@ from absl.testing import absltest, parameterized
 from google.api_core import exceptions as google_exceptions
 
 from kinetic.infra.container_builder import (
+  _ar_build_config,
   _filter_jax_requirements,
   _generate_dockerfile,
   _hash_requirements,
   _image_exists,
+  _pack_build_context,
   _parse_pyproject_dependencies,
+  _prepare_dockerfile,
   get_or_build_container,
 )
 
@@ -222,6 +226,25 @@ class TestGenerateDockerfile(parameterized.TestCase):
     )
     self.assertIn(expected_substring, content)
 
+  def test_layers_ordered_by_change_frequency(self):
+    content = _generate_dockerfile(
+      base_image="python:3.12-slim",
+      has_requirements=True,
+      category="cpu",
+    )
+    positions = [
+      content.index(marker)
+      for marker in (
+        "FROM python:3.12-slim",
+        "apt-get install",
+        "COPY --from=ghcr.io/astral-sh/uv",
+        "COPY requirements.txt",
+        "uv pip install",
+        "COPY remote_runner.py",
+      )
+    ]
+    self.assertEqual(positions, sorted(positions))
+
   def test_single_install_command(self):
     content = _generate_dockerfile(
       base_image="python:3.12-slim",
@@ -472,5 +495,75 @@ class TestPrepareRequirementsContent(absltest.TestCase):
     self.assertIsNone(prepare_requirements_content(path))
 
 
+class TestArBuildConfig(absltest.TestCase):
+  def test_without_cache_ref_builds_single_tag(self):
+    config = _ar_build_config("repo/base:cpu-abc", "bucket", "src.tgz", "sa")
+
+    self.assertEqual(
+      list(config.steps[0].args), ["build", "-t", "repo/base:cpu-abc", "."]
+    )
+    self.assertEqual(list(config.images), ["repo/base:cpu-abc"])
+
+  def test_cache_ref_imports_and_exports_layer_cache(self):
+    config = _ar_build_config(
+      "repo/base:cpu-abc",
+      "bucket",
+      "src.tgz",
+      "sa",
+      cache_ref="repo/base:cpu-buildcache",
+    )
+
+    step = config.steps[0]
+    args = list(step.args)
+    self.assertIn("DOCKER_BUILDKIT=1", list(step.env))
+    self.assertIn("BUILDKIT_INLINE_CACHE=1", args)
+    self.assertEqual(
+      args[args.index("--cache-from") + 1], "repo/base:cpu-buildcache"
+    )
+    self.assertEqual(
+      list(config.images), ["repo/base:cpu-abc", "repo/base:cpu-buildcache"]
+    )
+
+
+class TestPackBuildContext(absltest.TestCase):
+  def setUp(self):
+    super().setUp()
+    td = tempfile.TemporaryDirectory()
+    self.addCleanup(td.cleanup)
+    self.tmpdir = td.name
+
+  def _members(self, tarball_path):
+    with tarfile.open(tarball_path, "r:gz") as tar:
+      return {
+        m.name: tar.extractfile(m).read().decode() for m in tar.getmembers()
+      }
+
+  def test_custom_dockerfile_is_packed_without_staging_copy(self):
+    custom_dir = tempfile.TemporaryDirectory()
+    self.addCleanup(custom_dir.cleanup)
+    custom = os.path.join(custom_dir.name, "Custom.dockerfile")
+    with open(custom, "w") as f:
+      f.write("FROM scratch\n")
+
+    dockerfile_path = _prepare_dockerfile(self.tmpdir, "cpu", custom)
+    members = self._members(_pack_build_context(self.tmpdir, dockerfile_path))
+
+    self.assertEqual(dockerfile_path, custom)
+    self.assertFalse(os.path.exists(os.path.join(self.tmpdir, "Dockerfile")))
+    self.assertEqual(members["Dockerfile"], "FROM scratch\n")
+    self.assertIn("remote_runner.py", members)
+
+  def test_generated_dockerfile_is_packed(self):
+    dockerfile_path = _prepare_dockerfile(self.tmpdir, "cpu", None)
+    members = self._members(_pack_build_context(self.tmpdir, dockerfile_path))
+
+    self.assertTrue(members["Dockerfile"].startswith("FROM python:"))
+    self.assertIn("remote_runner.py", members)
+    # The runner is read from the package, not staged in the build dir.
+    self.assertCountEqual(
+      os.listdir(self.tmpdir), ["Dockerfile", "source.tar.gz"]
+    )
+
+
 if __name__ == "__main__":
   absltest.main()
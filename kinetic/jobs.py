@@ -6,7 +6,6 @@ for cross-session reattachment and `list_jobs()` for discovery.
 """
 
 import contextlib
-import os
 import subprocess
 import time
 from collections.abc import Callable
@@ -17,9 +16,8 @@ from typing import Any
 import cloudpickle
 from absl import logging
 from google.api_core import exceptions as google_exceptions
-from kubernetes import client
 
-from kinetic.backend import gke_client, pathways_client
+from kinetic.backend import gke_client, k8s_utils, pathways_client
 from kinetic.backend.log_streaming import LogStreamer
 from kinetic.cli.profiles import resolve_infra
 from kinetic.constants import build_bucket_name
@@ -197,21 +195,20 @@ class JobHandle:
 
   def _download_result_payload(self) -> dict[str, Any]:
     """Download and deserialize the remote result payload."""
-    result_path = storage.download_result(
+    # Unpickle straight from the blob stream rather than staging the
+    # (possibly large) result on local disk first.
+    with storage.open_result(
       self.bucket_name,
       self.job_id,
       project=self.project,
+    ) as f:
+      payload = cloudpickle.load(f)
+    logging.info(
+      "Downloaded result from gs://%s/%s/result.pkl",
+      self.bucket_name,
+      self.job_id,
     )
-    try:
-      with open(result_path, "rb") as f:
-        return cloudpickle.load(f)
-    finally:
-      try:
-        os.remove(result_path)
-      except OSError as e:
-        logging.warning(
-          "Failed to remove temporary result file %s: %s", result_path, e
-        )
+    return payload
 
   def _download_result_payload_with_backoff(
     self, deadline: float | None
@@ -250,7 +247,7 @@ class JobHandle:
   def _stream_logs(self) -> None:
     """Stream logs to stdout via LogStreamer (blocking)."""
     self._ensure_credentials()
-    core_v1 = client.CoreV1Api()
+    core_v1 = k8s_utils.core_v1()
     pod_name = self._get_pod_name()
     if pod_name is None:
       raise RuntimeError(
@@ -374,7 +371,7 @@ class JobHandle:
 
     if stream_logs:
       self._ensure_credentials()
-      streamer_ctx = LogStreamer(client.CoreV1Api(), self.namespace)
+      streamer_ctx = LogStreamer(k8s_utils.core_v1(), self.namespace)
 
     with streamer_ctx if streamer_ctx is not None else contextlib.nullcontext():
       while True:
@@ -1,11 +1,13 @@
 """Tests for kinetic.jobs — async job handles and observation API."""
 
+import io
 import json
 import os
 import tempfile
 from unittest import mock
 from unittest.mock import MagicMock
 
+import cloudpickle
 from absl.testing import absltest
 from google.api_core import exceptions as google_exceptions
 
@@ -317,7 +319,7 @@ class TestJobHandleMethods(absltest.TestCase):
     with (
       mock.patch("kinetic.jobs.ensure_credentials"),
       mock.patch.object(handle, "_get_pod_name", return_value="pod-1"),
-      mock.patch("kinetic.jobs.client.CoreV1Api"),
+      mock.patch("kinetic.jobs.k8s_utils.core_v1"),
       mock.patch(
         "kinetic.jobs.LogStreamer",
         return_value=mock_streamer,
@@ -345,7 +347,7 @@ class TestJobHandleMethods(absltest.TestCase):
         side_effect=lambda **kw: call_order.append("ensure_credentials"),
       ),
       mock.patch(
-        "kinetic.jobs.client.CoreV1Api",
+        "kinetic.jobs.k8s_utils.core_v1",
         side_effect=lambda: call_order.append("CoreV1Api") or MagicMock(),
       ),
       mock.patch.object(handle, "_get_pod_name", return_value="pod-1"),
@@ -567,6 +569,21 @@ class TestJobHandleMethods(absltest.TestCase):
 
     self.assertEqual(result, 7)
 
+  def test_result_payload_is_unpickled_from_blob_stream(self):
+    handle = self._make_handle()
+    stream = io.BytesIO(cloudpickle.dumps({"success": True, "result": 3}))
+
+    with mock.patch(
+      "kinetic.jobs.storage.open_result", return_value=stream
+    ) as mock_open:
+      payload = handle._download_result_payload()
+
+    self.assertEqual(payload, {"success": True, "result": 3})
+    mock_open.assert_called_once_with(
+      handle.bucket_name, handle.job_id, project=handle.project
+    )
+    self.assertTrue(stream.closed)
+
   def test_cancel_deletes_only_k8s_resources(self):
     handle = self._make_handle()
 
@@ -670,7 +687,7 @@ class TestResultLogStreaming(absltest.TestCase):
       ),
       mock.patch.object(handle, "_ensure_credentials"),
       mock.patch.object(handle, "_get_pod_name", return_value="pod-1"),
-      mock.patch("kinetic.jobs.client.CoreV1Api"),
+      mock.patch("kinetic.jobs.k8s_utils.core_v1"),
       mock.patch(
         "kinetic.jobs.LogStreamer", return_value=mock_streamer
       ) as mock_cls,
@@ -704,7 +721,7 @@ class TestResultLogStreaming(absltest.TestCase):
       ),
       mock.patch.object(handle, "_ensure_credentials"),
       mock.patch.object(handle, "_get_pod_name") as mock_pod,
-      mock.patch("kinetic.jobs.client.CoreV1Api"),
+      mock.patch("kinetic.jobs.k8s_utils.core_v1"),
       mock.patch("kinetic.jobs.LogStreamer", return_value=mock_streamer),
       mock.patch.object(
         handle,
@@ -739,7 +756,7 @@ class TestResultLogStreaming(absltest.TestCase):
     with (
       mock.patch.object(handle, "status", return_value=JobStatus.SUCCEEDED),
       mock.patch.object(handle, "_ensure_credentials", side_effect=track_creds),
-      mock.patch("kinetic.jobs.client.CoreV1Api", side_effect=track_core_v1),
+      mock.patch("kinetic.jobs.k8s_utils.core_v1", side_effect=track_core_v1),
       mock.patch("kinetic.jobs.LogStreamer", return_value=mock_streamer),
       mock.patch.object(
         handle,
@@ -758,7 +775,7 @@ class TestResultLogStreaming(absltest.TestCase):
 
     with (
       mock.patch.object(handle, "status", return_value=JobStatus.SUCCEEDED),
-      mock.patch("kinetic.jobs.client.CoreV1Api") as mock_api,
+      mock.patch("kinetic.jobs.k8s_utils.core_v1") as mock_api,
       mock.patch("kinetic.jobs.LogStreamer") as mock_cls,
       mock.patch.object(
         handle,
@@ -27,6 +27,10 @@ from google.cloud.storage import transfer_manager
 
 _DOWNLOAD_BATCH_SIZE = 10000
 
+# Pickle protocol 5 (PEP 574) writes array buffers without an extra copy;
+# matches kinetic.utils.packager.PAYLOAD_PICKLE_PROTOCOL on the client.
+_RESULT_PICKLE_PROTOCOL = 5
+
 # Sentinel blob name written by the leader once it has finished
 # waiting for a debugger client and is about to call the user
 # function. Workers poll for this to stay in sync with the leader.
@@ -220,7 +224,7 @@ def main():
 
     try:
       with open(result_path, "wb") as f:
-        cloudpickle.dump(result_payload, f)
+        cloudpickle.dump(result_payload, f, protocol=_RESULT_PICKLE_PROTOCOL)
     except (pickle.PicklingError, TypeError) as serialize_err:
       logging.error("Failed to serialize result: %s", serialize_err)
       fallback_payload = {
@@ -232,7 +236,7 @@ def main():
         "traceback": remote_traceback,
       }
       with open(result_path, "wb") as f:
-        cloudpickle.dump(fallback_payload, f)
+        cloudpickle.dump(fallback_payload, f, protocol=_RESULT_PICKLE_PROTOCOL)
 
     # Upload result to Cloud Storage
     logging.info("Uploading result...")
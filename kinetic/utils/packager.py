@@ -5,51 +5,227 @@ payload with cloudpickle, and extracting/replacing Data objects in
 arbitrarily nested arg structures.
 """
 
+import contextlib
+import hashlib
 import os
+import shutil
+import tempfile
+import time
 import zipfile
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from typing import Any
 
 import cloudpickle
+from absl import logging
 
+from kinetic.constants import RACY_MTIME_NS
 from kinetic.data import Data
 
+# Protocol 5 (PEP 574) serializes buffer-backed objects such as NumPy
+# arrays from their memory directly instead of via an intermediate bytes
+# copy.  Pinned so payloads stay readable by the runner in older images
+# even if cloudpickle's default changes.
+PAYLOAD_PICKLE_PROTOCOL = 5
+
 # Type alias for a position path through nested args, e.g. ("arg", 0, "key").
 PositionPath = tuple[str | int, ...]
 
+# Directory names pruned from the working-directory walk.  These hold VCS
+# metadata or tool caches that are never needed on the remote pod, so the
+# walk skips them entirely instead of descending and filtering per file.
+_EXCLUDED_DIRS = frozenset(
+  {".git", "__pycache__", ".pytest_cache", ".mypy_cache", ".ruff_cache"}
+)
+# Compiled bytecode outside ``__pycache__`` (e.g. Python 2 style ``.pyc``
+# siblings) is equally stale on the remote interpreter.
+_EXCLUDED_SUFFIXES = (".pyc",)
+
+# DEFLATE level for the context zip.  Level 1 compresses source trees
+# roughly twice as fast as the default 6 for ~15% larger archives, which is
+# the better trade for an archive that is uploaded once and unpacked once.
+_ZIP_COMPRESSLEVEL = 1
+
+# Files that are already compressed are stored as-is rather than spending
+# CPU on a DEFLATE pass that cannot shrink them.
+_STORED_SUFFIXES = (
+  ".7z",
+  ".bz2",
+  ".gz",
+  ".jpeg",
+  ".jpg",
+  ".npz",
+  ".png",
+  ".tgz",
+  ".whl",
+  ".xz",
+  ".zip",
+  ".zst",
+)
+
+# Cached context zips kept in ``cache_dir``; the least recently used are
+# evicted beyond this count.
+_CONTEXT_CACHE_MAX_ENTRIES = 8
+
+
+def _iter_context_files(
+  base_dir: str, exclude_paths: set[str] | None
+) -> Iterator[tuple[str, str]]:
+  """Yield ``(file_path, archive_name)`` for files to include in the zip."""
+  exclude_paths = exclude_paths or set()
+  normalized_excludes = {os.path.normpath(p) for p in exclude_paths}
+
+  for root, dirs, files in os.walk(base_dir):
+    # Prune cache/VCS and Data-referenced directories before descending
+    dirs[:] = [
+      d
+      for d in dirs
+      if d not in _EXCLUDED_DIRS
+      and os.path.normpath(os.path.join(root, d)) not in normalized_excludes
+    ]
+
+    for file in files:
+      if file.endswith(_EXCLUDED_SUFFIXES):
+        continue
+      file_path = os.path.join(root, file)
+      if os.path.normpath(file_path) in normalized_excludes:
+        continue
+      yield file_path, os.path.relpath(file_path, base_dir)
+
+
+def _write_zip(files: list[tuple[str, str]], output_path: str) -> None:
+  with zipfile.ZipFile(
+    output_path,
+    "w",
+    zipfile.ZIP_DEFLATED,
+    compresslevel=_ZIP_COMPRESSLEVEL,
+  ) as zipf:
+    for file_path, archive_name in files:
+      compress_type = (
+        zipfile.ZIP_STORED
+        if file_path.lower().endswith(_STORED_SUFFIXES)
+        else None
+      )
+      zipf.write(file_path, archive_name, compress_type=compress_type)
+
+
+def _fingerprint_files(
+  base_dir: str, files: list[tuple[str, str]]
+) -> str | None:
+  """Hash the path and stat identity of every file; None if any is too fresh.
+
+  The inode and ctime are included alongside mtime and size so that a
+  file replaced with the same size and a preserved mtime (``cp -p``,
+  ``rsync -a``, ``tar x``) still changes the fingerprint.
+  """
+  h = hashlib.blake2b(digest_size=20)
+  h.update(os.path.abspath(base_dir).encode())
+  racy_after = time.time_ns() - RACY_MTIME_NS
+  for file_path, archive_name in files:
+    st = os.stat(file_path)
+    if st.st_mtime_ns >= racy_after:
+      return None
+    h.update(
+      f"\0{archive_name}\0{st.st_ino}\0{st.st_ctime_ns}"
+      f"\0{st.st_mtime_ns}\0{st.st_size}".encode()
+    )
+  return h.hexdigest()
+
+
+def _prune_context_cache(cache_dir: str) -> None:
+  entries = [
+    e for e in os.scandir(cache_dir) if e.is_file() and e.name.endswith(".zip")
+  ]
+  entries.sort(key=lambda e: e.stat().st_mtime_ns, reverse=True)
+  for entry in entries[_CONTEXT_CACHE_MAX_ENTRIES:]:
+    with contextlib.suppress(FileNotFoundError):
+      os.remove(entry.path)
+
+
+def _zip_via_cache(
+  base_dir: str,
+  files: list[tuple[str, str]],
+  output_path: str,
+  cache_dir: str,
+) -> bool:
+  """Materialize *output_path* from the context cache, filling it on a miss.
+
+  Returns False if the directory cannot be cached and must be zipped
+  directly.
+  """
+  fingerprint = _fingerprint_files(base_dir, files)
+  if fingerprint is None:
+    return False
+
+  cached_path = os.path.join(cache_dir, f"{fingerprint}.zip")
+  if os.path.exists(cached_path):
+    logging.info("Reusing cached working directory zip %s", cached_path)
+    os.utime(cached_path)
+  else:
+    os.makedirs(cache_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    os.close(fd)
+    try:
+      _write_zip(files, tmp_path)
+      os.replace(tmp_path, cached_path)
+    except BaseException:
+      os.remove(tmp_path)
+      raise
+    _prune_context_cache(cache_dir)
+
+  if os.path.exists(output_path):
+    os.remove(output_path)
+  try:
+    os.link(cached_path, output_path)
+  except OSError:
+    shutil.copyfile(cached_path, output_path)
+  return True
+
 
 def zip_working_dir(
-  base_dir: str, output_path: str, exclude_paths: set[str] | None = None
+  base_dir: str,
+  output_path: str,
+  exclude_paths: set[str] | None = None,
+  cache_dir: str | None = None,
 ) -> None:
   """Zip a directory into a ZIP archive, excluding common non-source files.
 
-  Excludes ``.git``, ``__pycache__``, and any paths in *exclude_paths*
-  (which may be files or directories).
+  Excludes VCS and tool-cache directories (``.git``, ``__pycache__``,
+  ``.pytest_cache``, ...), stray ``.pyc`` files, and any paths in
+  *exclude_paths* (which may be files or directories).
+
+  If *cache_dir* is given, archives are cached there keyed by a
+  fingerprint of every included file's path, mtime and size, and an
+  unchanged directory is served from the cache instead of recompressed.
 
   Args:
       base_dir: Root directory to zip.
       output_path: Destination path for the ZIP file.
       exclude_paths: Absolute paths to skip during archiving.
+      cache_dir: Optional directory for cached archives.
   """
-  exclude_paths = exclude_paths or set()
-  normalized_excludes = {os.path.normpath(p) for p in exclude_paths}
+  files = list(_iter_context_files(base_dir, exclude_paths))
+  if cache_dir is not None:
+    try:
+      if _zip_via_cache(base_dir, files, output_path, cache_dir):
+        return
+    except OSError as e:
+      logging.warning("Working directory zip cache unavailable: %s", e)
+  _write_zip(files, output_path)
+
+
+class _HashingWriter:
+  """Write-only file wrapper that SHA-256 hashes everything written."""
 
-  with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as zipf:
-    for root, dirs, files in os.walk(base_dir):
-      # Exclude .git, __pycache__, and Data-referenced directories
-      dirs[:] = [
-        d
-        for d in dirs
-        if d not in [".git", "__pycache__"]
-        and os.path.normpath(os.path.join(root, d)) not in normalized_excludes
-      ]
+  def __init__(self, f):
+    self._f = f
+    self._hasher = hashlib.sha256()
 
-      for file in files:
-        file_path = os.path.join(root, file)
-        if os.path.normpath(file_path) in normalized_excludes:
-          continue
-        archive_name = os.path.relpath(file_path, base_dir)
-        zipf.write(file_path, archive_name)
+  def write(self, data) -> int:
+    self._hasher.update(data)
+    return self._f.write(data)
+
+  def hexdigest(self) -> str:
+    return self._hasher.hexdigest()
 
 
 def save_payload(
@@ -60,7 +236,7 @@ def save_payload(
   output_path: str,
   volumes: list[dict[str, Any]] | None = None,
   working_dir: str | None = None,
-) -> None:
+) -> str:
   """Serialize a function call payload with cloudpickle.
 
   The resulting pickle file contains a dict with keys ``func``, ``args``,
@@ -74,6 +250,10 @@ def save_payload(
       output_path: Destination path for the pickle file.
       volumes: Optional list of volume data-ref dicts.
       working_dir: Optional client-side working directory to preserve.
+
+  Returns:
+      SHA-256 hex digest of the written file, computed while writing so
+      a large payload is not read back just to hash it.
   """
   payload: dict[str, Any] = {
     "func": func,
@@ -86,7 +266,9 @@ def save_payload(
   if working_dir:
     payload["working_dir"] = working_dir
   with open(output_path, "wb") as f:
-    cloudpickle.dump(payload, f)
+    writer = _HashingWriter(f)
+    cloudpickle.dump(payload, writer, protocol=PAYLOAD_PICKLE_PROTOCOL)
+  return writer.hexdigest()
 
 
 def extract_data_refs(
@@ -1,9 +1,12 @@
 """Tests for kinetic.utils.packager — zip and payload serialization."""
 
+import hashlib
 import os
 import pathlib
 import tempfile
+import time
 import zipfile
+from unittest import mock
 
 import cloudpickle
 import numpy as np
@@ -68,6 +71,18 @@ class TestZipWorkingDir(absltest.TestCase):
     self.assertTrue(all("__pycache__" not in n for n in names))
     self.assertIn("mod.py", names)
 
+  def test_excludes_tool_caches_and_stray_bytecode(self):
+    tmp_path = _make_temp_path(self)
+    src = tmp_path / "src"
+    src.mkdir()
+    for cache in (".pytest_cache", ".mypy_cache", ".ruff_cache"):
+      (src / cache).mkdir()
+      (src / cache / "state").write_text("cache")
+    (src / "legacy.pyc").write_bytes(b"\x00")
+    (src / "mod.py").write_text("code")
+
+    self.assertEqual(self._zip_and_list(src, tmp_path), {"mod.py"})
+
   def test_preserves_nested_structure(self):
     tmp_path = _make_temp_path(self)
     src = tmp_path / "src"
@@ -127,6 +142,102 @@ class TestZipWorkingDir(absltest.TestCase):
     names = self._zip_and_list(src, tmp_path, exclude_paths={str(d1), str(d2)})
     self.assertEqual(names, {"main.py"})
 
+  def test_already_compressed_files_are_stored(self):
+    tmp_path = _make_temp_path(self)
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "main.py").write_text("print('hi')\n" * 100)
+    (src / "weights.NPZ").write_bytes(b"\x00" * 1000)
+    out = tmp_path / "context.zip"
+
+    zip_working_dir(str(src), str(out))
+
+    with zipfile.ZipFile(str(out)) as zf:
+      self.assertEqual(
+        zf.getinfo("main.py").compress_type, zipfile.ZIP_DEFLATED
+      )
+      self.assertEqual(
+        zf.getinfo("weights.NPZ").compress_type, zipfile.ZIP_STORED
+      )
+      self.assertEqual(zf.read("weights.NPZ"), b"\x00" * 1000)
+
+
+class TestZipWorkingDirCache(absltest.TestCase):
+  def setUp(self):
+    super().setUp()
+    self.tmp_path = _make_temp_path(self)
+    self.src = self.tmp_path / "src"
+    self.src.mkdir()
+    self.cache_dir = str(self.tmp_path / "cache")
+
+  def _write(self, name, content):
+    """Write a file with an mtime safely outside the racy window."""
+    path = self.src / name
+    path.write_text(content)
+    old = time.time_ns() - 60 * 1_000_000_000
+    os.utime(path, ns=(old, old))
+    return path
+
+  def _zip(self, name="context.zip"):
+    out = self.tmp_path / name
+    zip_working_dir(str(self.src), str(out), cache_dir=self.cache_dir)
+    with zipfile.ZipFile(str(out)) as zf:
+      return {n: zf.read(n).decode() for n in zf.namelist()}
+
+  def test_unchanged_directory_is_not_rezipped(self):
+    self._write("a.py", "a")
+    self.assertEqual(self._zip("first.zip"), {"a.py": "a"})
+
+    with mock.patch("kinetic.utils.packager._write_zip") as mock_write:
+      self.assertEqual(self._zip("second.zip"), {"a.py": "a"})
+    mock_write.assert_not_called()
+    self.assertLen(os.listdir(self.cache_dir), 1)
+
+  def test_modified_file_invalidates_cache(self):
+    path = self._write("a.py", "a")
+    self._zip("first.zip")
+    path.write_text("changed")
+    old = time.time_ns() - 30 * 1_000_000_000
+    os.utime(path, ns=(old, old))
+
+    self.assertEqual(self._zip("second.zip"), {"a.py": "changed"})
+
+  def test_same_size_rewrite_with_preserved_mtime_invalidates_cache(self):
+    path = self._write("a.py", "a")
+    st = os.stat(path)
+    self._zip("first.zip")
+    path.write_text("b")
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    self.assertEqual(self._zip("second.zip"), {"a.py": "b"})
+
+  def test_replaced_file_with_preserved_mtime_invalidates_cache(self):
+    path = self._write("a.py", "a")
+    st = os.stat(path)
+    self._zip("first.zip")
+    replacement = self.tmp_path / "a.py.new"
+    replacement.write_text("b")
+    os.utime(replacement, ns=(st.st_atime_ns, st.st_mtime_ns))
+    os.replace(replacement, path)
+
+    self.assertEqual(self._zip("second.zip"), {"a.py": "b"})
+
+  def test_recently_modified_directory_is_not_cached(self):
+    (self.src / "a.py").write_text("a")
+
+    self.assertEqual(self._zip(), {"a.py": "a"})
+    self.assertFalse(os.path.exists(self.cache_dir))
+
+  def test_cache_is_bounded(self):
+    path = self._write("a.py", "0")
+    with mock.patch("kinetic.utils.packager._CONTEXT_CACHE_MAX_ENTRIES", 2):
+      for i in range(4):
+        old = time.time_ns() - (60 - i) * 1_000_000_000
+        os.utime(path, ns=(old, old))
+        self._zip(f"{i}.zip")
+
+    self.assertLen(os.listdir(self.cache_dir), 2)
+
 
 class TestSavePayload(absltest.TestCase):
   def _save_and_load(
@@ -176,6 +287,23 @@ class TestSavePayload(absltest.TestCase):
     result = payload["func"](*payload["args"], **payload["kwargs"])
     self.assertEqual(result, "Hi, World")
 
+  def test_returns_sha256_of_written_file(self):
+    tmp_path = _make_temp_path(self)
+    out = tmp_path / "payload.pkl"
+
+    digest = save_payload(
+      lambda: 1, (np.arange(1000),), {"k": "v"}, {}, str(out)
+    )
+
+    self.assertEqual(digest, hashlib.sha256(out.read_bytes()).hexdigest())
+
+  def test_payload_uses_pickle_protocol_5(self):
+    out = _make_temp_path(self) / "payload.pkl"
+    save_payload(abs, (-1,), {}, {}, str(out))
+
+    # Protocol >= 2 pickles start with PROTO (0x80) then the version byte.
+    self.assertEqual(out.read_bytes()[:2], b"\x80\x05")
+
   def test_roundtrip_lambda(self):
     tmp_path = _make_temp_path(self)
     payload = self._save_and_load(tmp_path, lambda x: x * 2, args=(5,))
@@ -4,8 +4,9 @@ from __future__ import annotations
 
 import json
 import os
-import tempfile
 import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO
 
 from absl import logging
 from google.cloud import exceptions as cloud_exceptions
@@ -19,6 +20,15 @@ from kinetic.data import Data
 _cached_clients: dict[str | None, storage.Client] = {}
 _client_lock = threading.Lock()
 
+# Artifacts at least this large are uploaded as parallel XML multipart
+# chunks; smaller ones go up in a single request.
+_PARALLEL_UPLOAD_THRESHOLD = 64 * 1024 * 1024
+_PARALLEL_UPLOAD_CHUNK_SIZE = 32 * 1024 * 1024
+_PARALLEL_UPLOAD_WORKERS = 4
+
+# The JSON API accepts at most 100 calls per batch request.
+_DELETE_BATCH_SIZE = 100
+
 
 def _get_client(project: str | None) -> storage.Client:
   """Return a cached storage client for the given project."""
@@ -72,21 +82,38 @@ def _delete_prefix(
   prefix: str,
   project: str | None = None,
 ) -> int:
-  """Delete all blobs under *prefix*. Returns the count deleted."""
-  _, bucket = _get_bucket(bucket_name, project)
+  """Delete all blobs under *prefix*. Returns the count deleted.
+
+  Deletes are sent as JSON API batch requests, so a job's artifacts are
+  removed in one round trip rather than one per object.
+  """
+  client, bucket = _get_bucket(bucket_name, project)
   blobs = list(bucket.list_blobs(prefix=prefix))
-  if not blobs:
-    return 0
-  try:
-    bucket.delete_blobs(blobs, retry=DEFAULT_RETRY)
-  except cloud_exceptions.NotFound:
+  deleted = 0
+  missing = 0
+  for start in range(0, len(blobs), _DELETE_BATCH_SIZE):
+    chunk = blobs[start : start + _DELETE_BATCH_SIZE]
+    try:
+      with client.batch():
+        bucket.delete_blobs(chunk)
+    except cloud_exceptions.GoogleCloudError:
+      # A failed batch reports only one of its errors, so re-send the
+      # chunk unbatched with retries.  Blobs that are already gone
+      # (including any the batch did delete) are reported as NotFound.
+      gone = []
+      bucket.delete_blobs(chunk, on_error=gone.append, retry=DEFAULT_RETRY)
+      deleted += len(chunk) - len(gone)
+      missing += len(gone)
+    else:
+      deleted += len(chunk)
+  if missing:
     logging.warning(
-      "Some blobs missing during cleanup of gs://%s/%s",
+      "%d blobs already gone during cleanup of gs://%s/%s",
+      missing,
       bucket_name,
       prefix,
-      exc_info=True,
     )
-  return len(blobs)
+  return deleted
 
 
 def blob_exists(
@@ -132,24 +159,31 @@ def upload_artifacts(
   """
   client, bucket = _get_bucket(bucket_name, project)
 
-  # Upload payload
-  blob = bucket.blob(f"{job_id}/payload.pkl")
-  blob.upload_from_filename(payload_path, retry=DEFAULT_RETRY)
+  # Payload, context and requirements are independent, so upload them
+  # concurrently; large files are additionally split into parallel chunks.
+  with ThreadPoolExecutor(max_workers=3) as pool:
+    futures = [
+      pool.submit(_upload_file, bucket, f"{job_id}/payload.pkl", payload_path),
+      pool.submit(_upload_file, bucket, f"{job_id}/context.zip", context_path),
+    ]
+    if requirements_content is not None:
+      futures.append(
+        pool.submit(
+          bucket.blob(f"{job_id}/requirements.txt").upload_from_string,
+          requirements_content,
+          retry=DEFAULT_RETRY,
+        )
+      )
+    for future in futures:
+      future.result()
+
   logging.info(
     "Uploaded payload to gs://%s/%s/payload.pkl", bucket_name, job_id
   )
-
-  # Upload context
-  blob = bucket.blob(f"{job_id}/context.zip")
-  blob.upload_from_filename(context_path, retry=DEFAULT_RETRY)
   logging.info(
     "Uploaded context to gs://%s/%s/context.zip", bucket_name, job_id
   )
-
-  # Upload requirements (prebuilt mode only)
   if requirements_content is not None:
-    blob = bucket.blob(f"{job_id}/requirements.txt")
-    blob.upload_from_string(requirements_content, retry=DEFAULT_RETRY)
     logging.info(
       "Uploaded requirements to gs://%s/%s/requirements.txt",
       bucket_name,
@@ -165,10 +199,30 @@ def upload_artifacts(
   )
 
 
-def download_result(
+def _upload_file(
+  bucket: storage.Bucket, blob_path: str, local_path: str
+) -> None:
+  """Upload *local_path* to *blob_path*, chunked in parallel when large."""
+  blob = bucket.blob(blob_path)
+  if os.path.getsize(local_path) < _PARALLEL_UPLOAD_THRESHOLD:
+    blob.upload_from_filename(local_path, retry=DEFAULT_RETRY)
+    return
+  transfer_manager.upload_chunks_concurrently(
+    local_path,
+    blob,
+    chunk_size=_PARALLEL_UPLOAD_CHUNK_SIZE,
+    worker_type=transfer_manager.THREAD,
+    max_workers=_PARALLEL_UPLOAD_WORKERS,
+  )
+
+
+def open_result(
   bucket_name: str, job_id: str, project: str | None = None
-) -> str:
-  """Download result from Cloud Storage.
+) -> BinaryIO:
+  """Open the result blob in Cloud Storage for streaming reads.
+
+  Nothing is written to local disk; the returned file object fetches
+  the blob in chunks as it is read.
 
   Args:
       bucket_name: Name of the GCS bucket
@@ -176,19 +230,12 @@ def download_result(
       project: GCP project ID (optional, uses env vars if not provided)
 
   Returns:
-      Local path to downloaded result file
+      A readable binary file object; close it (or use it as a context
+      manager) when done.
   """
   _, bucket = _get_bucket(bucket_name, project)
-
   blob = bucket.blob(f"{job_id}/result.pkl")
-  fd, local_path = tempfile.mkstemp(suffix=f"-{job_id}.pkl", prefix="result-")
-  os.close(fd)
-  blob.download_to_filename(local_path)
-  logging.info(
-    "Downloaded result from gs://%s/%s/result.pkl", bucket_name, job_id
-  )
-
-  return local_path
+  return blob.open("rb", retry=DEFAULT_RETRY)
 
 
 def upload_handle(
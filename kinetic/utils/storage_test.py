@@ -8,6 +8,7 @@ from unittest import mock
 from unittest.mock import MagicMock
 
 from absl.testing import absltest, parameterized
+from google.cloud import exceptions as cloud_exceptions
 
 from kinetic.constants import get_default_project
 from kinetic.data import Data
@@ -18,7 +19,7 @@ from kinetic.utils.storage import (
   _upload_directory,
   cleanup_artifacts,
   download_handle,
-  download_result,
+  open_result,
   upload_artifacts,
   upload_data,
   upload_handle,
@@ -46,6 +47,14 @@ class _GcsTestBase(absltest.TestCase):
 
 
 class TestUploadArtifacts(_GcsTestBase):
+  def setUp(self):
+    super().setUp()
+    tmp = _make_temp_path(self)
+    self.payload_path = tmp / "payload.pkl"
+    self.payload_path.write_bytes(b"payload")
+    self.context_path = tmp / "context.zip"
+    self.context_path.write_bytes(b"context")
+
   def test_uploads_payload_and_context(self):
     mock_bucket = self.mock_gcs.bucket.return_value
     mock_blob = mock_bucket.blob.return_value
@@ -53,8 +62,8 @@ class TestUploadArtifacts(_GcsTestBase):
     upload_artifacts(
       bucket_name="my-bucket",
       job_id="job-abc123",
-      payload_path="/tmp/payload.pkl",
-      context_path="/tmp/context.zip",
+      payload_path=str(self.payload_path),
+      context_path=str(self.context_path),
       project="test-project",
     )
 
@@ -66,63 +75,64 @@ class TestUploadArtifacts(_GcsTestBase):
     upload_artifacts(
       bucket_name="my-custom-bucket",
       job_id="job-123",
-      payload_path="/tmp/p.pkl",
-      context_path="/tmp/c.zip",
+      payload_path=str(self.payload_path),
+      context_path=str(self.context_path),
       project="proj",
     )
     self.mock_gcs.bucket.assert_called_with("my-custom-bucket")
 
-
-class TestDownloadResult(_GcsTestBase):
-  def test_downloads_result_blob(self):
+  def test_uploads_requirements(self):
     mock_bucket = self.mock_gcs.bucket.return_value
-    mock_blob = mock_bucket.blob.return_value
 
-    download_result("my-bucket", "job-abc", project="proj")
-
-    mock_bucket.blob.assert_called_once_with("job-abc/result.pkl")
-    mock_blob.download_to_filename.assert_called_once()
+    upload_artifacts(
+      bucket_name="my-bucket",
+      job_id="job-abc123",
+      payload_path=str(self.payload_path),
+      context_path=str(self.context_path),
+      project="proj",
+      requirements_content="numpy\n",
+    )
 
-  def test_returns_path_with_job_id(self):
-    result = download_result("my-bucket", "job-xyz", project="proj")
-    self.assertIn("result-", result)
-    self.assertIn("job-xyz.pkl", result)
+    mock_bucket.blob.assert_any_call("job-abc123/requirements.txt")
+    mock_bucket.blob.return_value.upload_from_string.assert_called_once_with(
+      "numpy\n", retry=DEFAULT_RETRY
+    )
 
-  def test_download_result_symlink_exploit(self):
-    # 1. Prepare temp directory for the test
-    tmp_dir = _make_temp_path(self)
+  def test_large_files_are_uploaded_in_parallel_chunks(self):
+    mock_bucket = self.mock_gcs.bucket.return_value
+    mock_blob = mock_bucket.blob.return_value
 
-    # Mock tempfile.gettempdir to return our test temp directory
-    with mock.patch(
-      "kinetic.utils.storage.tempfile.gettempdir", return_value=str(tmp_dir)
+    with (
+      mock.patch.object(storage_module, "_PARALLEL_UPLOAD_THRESHOLD", 4),
+      mock.patch(
+        "kinetic.utils.storage.transfer_manager.upload_chunks_concurrently"
+      ) as mock_chunks,
     ):
-      # 2. Create a victim file that we want to protect
-      victim_file = tmp_dir / "victim.txt"
-      victim_content = "sensitive data"
-      victim_file.write_text(victim_content)
-
-      # 3. Create a symlink at the predicted path pointing to the victim file
-      job_id = "job-exploit"
-      predicted_path = tmp_dir / f"result-{job_id}.pkl"
-      os.symlink(victim_file, predicted_path)
+      upload_artifacts(
+        bucket_name="my-bucket",
+        job_id="job-abc123",
+        payload_path=str(self.payload_path),
+        context_path=str(self.context_path),
+        project="proj",
+      )
 
-      # 4. Mock GCS download to simulate writing to the file
-      mock_bucket = self.mock_gcs.bucket.return_value
-      mock_blob = mock_bucket.blob.return_value
+    self.assertEqual(mock_chunks.call_count, 2)
+    uploaded = {c.args[0] for c in mock_chunks.call_args_list}
+    self.assertEqual(uploaded, {str(self.payload_path), str(self.context_path)})
+    mock_blob.upload_from_filename.assert_not_called()
 
-      def mock_download(filename):
-        with open(filename, "w") as f:
-          f.write("attack payload")
 
-      mock_blob.download_to_filename.side_effect = mock_download
+class TestOpenResult(_GcsTestBase):
+  def test_opens_result_blob_for_streaming(self):
+    mock_bucket = self.mock_gcs.bucket.return_value
+    mock_blob = mock_bucket.blob.return_value
 
-      # 5. Call download_result
-      download_result("my-bucket", job_id, project="proj")
+    reader = open_result("my-bucket", "job-abc", project="proj")
 
-      # 6. Verify if victim file was overwritten
-      # If vulnerable, victim_file content will be "attack payload"
-      # If secured, victim_file content should still be "sensitive data"
-      self.assertEqual(victim_file.read_text(), victim_content)
+    mock_bucket.blob.assert_called_once_with("job-abc/result.pkl")
+    mock_blob.open.assert_called_once_with("rb", retry=DEFAULT_RETRY)
+    self.assertIs(reader, mock_blob.open.return_value)
+    mock_blob.download_to_filename.assert_not_called()
 
 
 class TestHandleStorage(_GcsTestBase):
@@ -156,27 +166,82 @@ class TestHandleStorage(_GcsTestBase):
 
 
 class TestCleanupArtifacts(_GcsTestBase):
+  def setUp(self):
+    super().setUp()
+    self.mock_bucket = self.mock_gcs.bucket.return_value
+
   def test_deletes_all_blobs(self):
-    mock_bucket = self.mock_gcs.bucket.return_value
     blob1 = MagicMock()
     blob2 = MagicMock()
     blob3 = MagicMock()
-    mock_bucket.list_blobs.return_value = [blob1, blob2, blob3]
+    self.mock_bucket.list_blobs.return_value = [blob1, blob2, blob3]
 
-    cleanup_artifacts("my-bucket", "job-abc", project="proj")
+    count = storage_module._delete_prefix("my-bucket", "job-abc/", "proj")
+
+    self.assertEqual(count, 3)
+    self.mock_bucket.list_blobs.assert_called_once_with(prefix="job-abc/")
+    self.mock_bucket.delete_blobs.assert_called_once_with([blob1, blob2, blob3])
+    self.mock_gcs.batch.assert_called_once_with()
+
+  def test_large_prefix_split_into_batches(self):
+    blobs = [MagicMock() for _ in range(250)]
+    self.mock_bucket.list_blobs.return_value = blobs
+
+    count = storage_module._delete_prefix("my-bucket", "job-abc/", "proj")
+
+    self.assertEqual(count, 250)
+    self.assertEqual(self.mock_gcs.batch.call_count, 3)
+    self.assertEqual(
+      [len(c.args[0]) for c in self.mock_bucket.delete_blobs.call_args_list],
+      [100, 100, 50],
+    )
 
-    mock_bucket.list_blobs.assert_called_once_with(prefix="job-abc/")
-    mock_bucket.delete_blobs.assert_called_once_with(
-      [blob1, blob2, blob3], retry=DEFAULT_RETRY
+  def test_failed_batch_is_resent_unbatched_with_retry(self):
+    blobs = [MagicMock() for _ in range(150)]
+    self.mock_bucket.list_blobs.return_value = blobs
+    self.mock_gcs.batch.return_value.__exit__.side_effect = [
+      cloud_exceptions.NotFound("gone"),
+      None,
+    ]
+
+    def delete_blobs(chunk, on_error=None, retry=None):
+      if on_error is not None:
+        on_error(chunk[0])
+
+    self.mock_bucket.delete_blobs.side_effect = delete_blobs
+
+    count = storage_module._delete_prefix("my-bucket", "job-abc/", "proj")
+
+    self.assertEqual(count, 149)
+    self.assertEqual(self.mock_gcs.batch.call_count, 2)
+    self.assertEqual(
+      self.mock_bucket.delete_blobs.call_args_list[1],
+      mock.call(blobs[:100], on_error=mock.ANY, retry=DEFAULT_RETRY),
     )
+    self.assertEqual(
+      self.mock_bucket.delete_blobs.call_args_list[2].args[0], blobs[100:]
+    )
+
+  def test_unbatched_failure_propagates(self):
+    self.mock_bucket.list_blobs.return_value = [MagicMock()]
+    self.mock_gcs.batch.return_value.__exit__.side_effect = (
+      cloud_exceptions.Forbidden("denied")
+    )
+    self.mock_bucket.delete_blobs.side_effect = [
+      None,
+      cloud_exceptions.Forbidden("denied"),
+    ]
+
+    with self.assertRaises(cloud_exceptions.Forbidden):
+      storage_module._delete_prefix("my-bucket", "job-abc/", "proj")
 
   def test_no_blobs_no_error(self):
-    mock_bucket = self.mock_gcs.bucket.return_value
-    mock_bucket.list_blobs.return_value = []
+    self.mock_bucket.list_blobs.return_value = []
 
     cleanup_artifacts("my-bucket", "job-abc", project="proj")
 
-    mock_bucket.list_blobs.assert_called_once_with(prefix="job-abc/")
+    self.mock_bucket.list_blobs.assert_called_once_with(prefix="job-abc/")
+    self.mock_gcs.batch.assert_not_called()
 
 
 class TestGetProject(parameterized.TestCase):